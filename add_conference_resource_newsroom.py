@@ -3,7 +3,11 @@ Sample Usage:
 - To add newsroom summaries to all talks in a JSON file and output to conference_resources.json:
   python newsroom_adder.py 2023-october.json
   (This will process all talks, search for newsroom URLs using Grok with retry (limit 4→8), 
-   prompt for manual input on misses, and output to conference_resources.json)
+   prompt for manual input on misses, and output to conference_resources.json.
+   Grok lookups are cached in .newsroom_cache so re-runs skip talks that were already searched)
+
+- To look up several talks per Grok request (fewer round trips, one search budget shared by the batch):
+  python newsroom_adder.py 2023-october.json --batch-size 8
 
 - To add a newsroom summary to a single talk by title:
   python newsroom_adder.py 2023-october.json --talk "Think Celestial!"
@@ -19,6 +23,13 @@ import os
 import json
 import sys
 import re
+import time
+import random
+import shelve
+import hashlib
+import atexit
+import threading
+from functools import lru_cache
 from dotenv import load_dotenv
 from xai_sdk import Client
 from xai_sdk.chat import user
@@ -26,78 +37,302 @@ from xai_sdk.search import SearchParameters, web_source
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+try:
+    import orjson  # optional: much faster JSON parsing for the resources and conference files
+except ImportError:
+    orjson = None
+
 # Load .env from same directory
 load_dotenv()
 # Now access the key
 XAI_API_KEY = os.getenv('XAI_API_KEY')
 
+# Backoff settings for transient Grok failures (rate limits, timeouts, 5xx)
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 30.0
+TRANSIENT_STATUS_CODES = ('RESOURCE_EXHAUSTED', 'UNAVAILABLE', 'DEADLINE_EXCEEDED', 'INTERNAL', 'ABORTED')
+
+# On-disk cache of Grok lookups so re-runs don't pay for talks already searched
+CACHE_FILE = '.newsroom_cache'
+MISS_TTL = 7 * 24 * 60 * 60  # re-query misses after a week in case a summary was published since
+_cache = shelve.open(CACHE_FILE)
+_cache_lock = threading.Lock()
+atexit.register(_cache.close)
+
+# Save conference_resources.json after this many completed lookups during long runs
+CHECKPOINT_EVERY = 10
+
+# Client-side rate limit so the worker pool doesn't fire every request at once and trip 429s
+REQUESTS_PER_MINUTE = int(os.getenv('GROK_REQUESTS_PER_MINUTE', '60'))
+REQUEST_BURST = 5
+
+class RateLimiter:
+    """Token bucket shared by all worker threads"""
+    def __init__(self, per_minute, burst):
+        self.interval = 60.0 / per_minute
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) / self.interval)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * self.interval
+            time.sleep(wait)
+
+_rate_limiter = RateLimiter(REQUESTS_PER_MINUTE, REQUEST_BURST)
+
+# Bulkhead: cap concurrent Grok calls below the worker count so a stalled backend can't wedge every thread
+MAX_IN_FLIGHT = 10
+IN_FLIGHT_TIMEOUT = 60
+_in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Shared xAI client so all worker threads reuse one gRPC channel instead of reconnecting per talk"""
+    return Client(api_key=XAI_API_KEY)
+
+BY_RE = re.compile(r'By\s+', re.IGNORECASE)
+TITLE_RE = re.compile(r'^(Elder|President|Sister|Brother)\s+', re.IGNORECASE)
+NEWSROOM_URL_RE = re.compile(r'https?://(?:[\w-]+\.)*thechurchnews\.com/[^\s<>()\[\]"\']+')
+
+@lru_cache(maxsize=1024)
 def normalize_speaker(speaker):
-    speaker = re.sub(r'By\s+', '', speaker, flags=re.IGNORECASE)
-    speaker = re.sub(r'^(Elder|President|Sister|Brother)\s+', '', speaker, flags=re.IGNORECASE)
-    return speaker.strip()
+    return TITLE_RE.sub('', BY_RE.sub('', speaker)).strip()
+
+@lru_cache(maxsize=128)
+def get_role_prefix(speaker_role):
+    """Search prefix for a role; memoized since a conference only has a handful of distinct roles"""
+    if not speaker_role:
+        return ''
+    role_lower = speaker_role.lower()
+    if 'president of the church' in role_lower:
+        return 'president '
+    elif 'quorum' in role_lower or 'seventy' in role_lower:
+        return 'elder '
+    elif 'president' in role_lower:  # for general organization presidents, assuming women
+        return 'sister '
+    # add more if needed, e.g., brother
+    return ''
 
+@lru_cache(maxsize=1024)
 def get_speaker_search_term(speaker, speaker_role):
-    prefix = ''
-    if speaker_role:
-        role_lower = speaker_role.lower()
-        if 'president of the church' in role_lower:
-            prefix = 'president '
-        elif 'quorum' in role_lower or 'seventy' in role_lower:
-            prefix = 'elder '
-        elif 'president' in role_lower:  # for general organization presidents, assuming women
-            prefix = 'sister '
-        # add more if needed, e.g., brother
-    last_name = speaker.split()[-1].lower()
-    return prefix + last_name
+    """Speaker as used in the search prompts; memoized since the plain, batch and broad prompts all rebuild it"""
+    return get_role_prefix(speaker_role) + speaker.split()[-1].lower()
+
+@lru_cache(maxsize=None)
+def build_talk_key(speaker, day, year, month):
+    """Memoized key construction, since each talk is keyed several times per run"""
+    last_name = normalize_speaker(speaker).split()[-1].lower()
+    return f"{year}/{month}/{day}{last_name}"
 
 def get_talk_key(talk, year, month):
     """Generate URL-style key: year/month/daylastnames"""
     day = talk.get('day', '01')  # default to 01 if no day
-    speaker = normalize_speaker(talk['speaker'])
-    last_name = speaker.split()[-1].lower()
-    return f"{year}/{month}/{day}{last_name}"
+    return build_talk_key(talk['speaker'], day, year, month)
+
+# Returned when Grok answered but found no summary, as opposed to None for a failed request
+NOT_FOUND = object()
+# Returned by ask_grok when no in-flight slot freed up in time: nothing was asked, so it's neither a miss nor worth a paid retry
+SKIPPED = object()
+
+def is_transient_error(e):
+    """Rate limits, timeouts and server errors are worth retrying; bad requests and auth errors are not"""
+    code = getattr(e, 'code', None)
+    if callable(code):
+        try:
+            return code().name in TRANSIENT_STATUS_CODES
+        except Exception:
+            pass
+    message = str(e)
+    return any(status in message for status in ('429', '500', '502', '503', '504'))
+
+def ask_grok(prompt, search_limit, label, mode="auto", allowed_websites=("thechurchnews.com",)):
+    """Send one Church News search prompt to Grok, retrying transient errors. Returns the reply text, None on error,
+    or SKIPPED if the request was never sent because no in-flight slot freed up."""
+    for attempt in range(MAX_RETRIES):
+        try:
+            client = _get_client()
+            chat = client.chat.create(
+                model="grok-4-fast",
+                search_parameters=SearchParameters(
+                    mode=mode,
+                    max_search_results=search_limit,
+                    return_citations=True,
+                    sources=[
+                        web_source(allowed_websites=list(allowed_websites) if allowed_websites else None),
+                    ],
+                ),
+            )
+            chat.append(user(prompt))
+            # Take the in-flight slot first, so a slot timeout never spends a rate-limiter token
+            if not _in_flight.acquire(timeout=IN_FLIGHT_TIMEOUT):
+                print(f'Too many Grok requests in flight; skipping {label} for now')
+                return SKIPPED
+            try:
+                _rate_limiter.acquire()
+                return chat.sample().content
+            finally:
+                _in_flight.release()
+        except Exception as e:
+            if attempt < MAX_RETRIES - 1 and is_transient_error(e):
+                # Exponential backoff with full jitter so parallel workers don't retry in lockstep
+                time.sleep(random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt)))
+                continue
+            print(f'Error finding newsroom summary URL with Grok for {label}: {e}')
+            return None
+
+def extract_newsroom_url(text):
+    match = NEWSROOM_URL_RE.search(text or '')
+    return match.group(0).rstrip('.,;') if match else None
 
 def find_newsroom_summary_url_with_grok(title, speaker, speaker_role, year, month, search_limit=4):
+    """Return the summary URL, NOT_FOUND if Grok answered without one, None if the request failed, or SKIPPED"""
     speaker_search = get_speaker_search_term(speaker, speaker_role)
     prompt = f'Search The Church News for the summary URL of the General Conference talk titled "{title}" by {speaker_search} from {month} {year}. Reply only with the URL if found, or "Not found" if not.'
-    try:
-        client = Client(api_key=XAI_API_KEY)
-        chat = client.chat.create(
-            model="grok-4-fast",
-            search_parameters=SearchParameters(
-                mode="auto",
-                max_search_results=search_limit,
-                return_citations=True,
-                sources=[
-                    web_source(allowed_websites=["thechurchnews.com"]),
-                ],
-            ),
-        )
-        chat.append(user(prompt))
-        response = chat.sample()
-        content = response.content.strip()
-        if content.startswith('http') and 'thechurchnews.com' in content:
-            return content
-        else:
-            return None
-    except Exception as e:
-        print(f'Error finding newsroom summary URL with Grok for "{title}": {e}')
-        return None
+    content = ask_grok(prompt, search_limit, f'"{title}"')
+    if content is None or content is SKIPPED:
+        return content
+    return extract_newsroom_url(content) or NOT_FOUND
+
+def find_newsroom_summary_url_broad(title, speaker, speaker_role, year, month):
+    """Wider fallback search for misses: always search, across the whole web, but still only accept a Church News URL"""
+    speaker_search = get_speaker_search_term(speaker, speaker_role)
+    prompt = f'Find the Church News (thechurchnews.com) article summarizing the General Conference talk titled "{title}" by {speaker_search} from {month} {year}. Reply only with the thechurchnews.com URL if found, or "Not found" if not.'
+    content = ask_grok(prompt, 8, f'"{title}" (broad search)', mode="on", allowed_websites=None)
+    return None if content is SKIPPED else extract_newsroom_url(content)
+
+def get_cache_key(title, speaker, year, month):
+    return hashlib.sha1(f"{title}|{normalize_speaker(speaker)}|{year}|{month}".encode()).hexdigest()
+
+def get_cached_url(cache_key):
+    """Return (hit, url) for a cached lookup; misses only count as hits until MISS_TTL expires"""
+    with _cache_lock:
+        entry = _cache.get(cache_key)
+    if entry and (entry['url'] or time.time() - entry['ts'] < MISS_TTL):
+        return True, entry['url']
+    return False, None
+
+def store_cached_url(cache_key, url):
+    with _cache_lock:
+        _cache[cache_key] = {'url': url, 'ts': time.time()}
+        _cache.sync()
 
 def find_newsroom_summary_url_with_retry(title, speaker, speaker_role, year, month):
-    """Try with limit 4, then retry with limit 8 if not found"""
+    """Try with limit 4, then retry with limit 8 only if the first request errored. Answers are cached on disk."""
+    cache_key = get_cache_key(title, speaker, year, month)
+    hit, url = get_cached_url(cache_key)
+    if hit:
+        return url
+
     # First attempt with limit 4
     url = find_newsroom_summary_url_with_grok(title, speaker, speaker_role, year, month, search_limit=4)
-    if url:
-        return url
-    
-    # Retry with limit 8
-    print(f'Retrying with higher search limit (8) for "{title}"...')
-    url = find_newsroom_summary_url_with_grok(title, speaker, speaker_role, year, month, search_limit=8)
+
+    # Retry with limit 8 on errors; a real "Not found" answer isn't worth paying for twice, and a skip asked nothing
+    if url is None:
+        print(f'Retrying with higher search limit (8) for "{title}"...')
+        url = find_newsroom_summary_url_with_grok(title, speaker, speaker_role, year, month, search_limit=8)
+
+    if url is None or url is SKIPPED:
+        return None  # errors and skips aren't cached so the next run tries again
+    url = None if url is NOT_FOUND else url
+    store_cached_url(cache_key, url)
     return url
 
+# Curly quotes the model may swap for straight ones (or the reverse) when echoing titles back
+TITLE_QUOTES = str.maketrans({'\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"'})
+
+def normalize_title(title):
+    """Title key for matching batch replies: straight quotes, single spaces, casefolded"""
+    return ' '.join(str(title).translate(TITLE_QUOTES).split()).casefold()
+
+def find_newsroom_urls_batch(queries, search_limit=8):
+    """Look up several talks in one Grok call. Takes (title, speaker, speaker_role, year, month) tuples from the
+    same conference and returns their URLs (or None) in the same order."""
+    urls = [None] * len(queries)
+    pending = []
+    for i, (title, speaker, speaker_role, year, month) in enumerate(queries):
+        cache_key = get_cache_key(title, speaker, year, month)
+        hit, urls[i] = get_cached_url(cache_key)
+        if not hit:
+            pending.append((i, cache_key))
+    if not pending:
+        return urls
+
+    year, month = queries[0][3], queries[0][4]
+    talks = [{"title": queries[i][0], "speaker": get_speaker_search_term(queries[i][1], queries[i][2])} for i, _ in pending]
+    prompt = (
+        f'Search The Church News for the summary URL of each General Conference talk below from {month} {year}. '
+        f'Reply only with a JSON object mapping each talk title to its URL, or null if not found.\n'
+        f'{json.dumps(talks)}'
+    )
+    content = ask_grok(prompt, search_limit, f'batch of {len(talks)} talks')
+    if content is None or content is SKIPPED:
+        return urls
+    try:
+        found = json.loads(content.strip().removeprefix('```json').strip('`').strip())
+    except ValueError:
+        print(f'Could not parse batch reply from Grok: {content[:200]}')
+        return urls
+    if not isinstance(found, dict):
+        return urls
+
+    found = {normalize_title(title): url for title, url in found.items()}
+    for i, cache_key in pending:
+        key = normalize_title(queries[i][0])
+        if key not in found:
+            continue  # Left out of the reply: not an answer, so leave it for the next lookup
+        answer = found[key]
+        if answer is not None and not isinstance(answer, str):
+            continue  # Malformed entry (e.g. a nested object), also not cached
+        urls[i] = extract_newsroom_url(answer)
+        store_cached_url(cache_key, urls[i])
+    return urls
+
+def cache_broad_result(future, cache_key):
+    """Done-callback for background broad searches: remember any URL found (errors and misses aren't cached)"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    url = future.result()
+    if url:
+        store_cached_url(cache_key, url)
+
+def set_resource(output_resources, conference_key, talk_key, name, url):
+    """Set one resource URL in place, creating the conference/talk entries as needed"""
+    output_resources.setdefault(conference_key, {}).setdefault(talk_key, {})[name] = url
+
+def load_json(path):
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_resources(output_resources, output_file):
+    """Write to a temp file and swap it in so an interrupted save never leaves a truncated JSON file"""
+    tmp_file = output_file + '.tmp'
+    # Always the stdlib writer: orjson would rewrite the committed files' \uXXXX escapes as raw UTF-8 on every save
+    with open(tmp_file, 'w') as f:
+        json.dump(output_resources, f, indent=2)
+    os.replace(tmp_file, output_file)
+
+def build_title_index(conference_data):
+    """Map casefolded talk titles to talks (first occurrence wins) for a single dict lookup"""
+    index = {}
+    for talks in conference_data['sessions'].values():
+        for talk in talks:
+            index.setdefault(talk['title'].casefold(), talk)
+    return index
+
 def process_single_talk(conference_data, target_title, manual_url=None, output_resources=None):
-    found = False
     year = conference_data.get('year')
     month = conference_data.get('month')
     conference_key = f"{year}-{month.replace(' ', '-').title()}"
@@ -105,46 +340,31 @@ def process_single_talk(conference_data, target_title, manual_url=None, output_r
     if not year or not month:
         print("Error: Year or month not found in JSON.")
         return
-    for session_name, talks in conference_data['sessions'].items():
-        for talk in talks:
-            if talk['title'].lower() == target_title.lower():
-                found = True
-                talk_key = get_talk_key(talk, year, month)
-                
-                # Check if already exists
-                if output_resources.get(conference_key, {}).get(talk_key, {}).get("Church News Summary") and not manual_url:
-                    print(f"Newsroom summary already present for \"{talk['title']}\". Skipping.")
-                    break
-                
-                url = manual_url
-                if not url:
-                    url = find_newsroom_summary_url_with_retry(talk['title'], talk['speaker'], talk['speaker_role'], year, month)
-                
-                if url:
-                    if conference_key not in output_resources:
-                        output_resources[conference_key] = {}
-                    output_resources[conference_key][talk_key] = {
-                        **output_resources[conference_key].get(talk_key, {}),
-                        "Church News Summary": url
-                    }
-                    print(f"Added newsroom summary for \"{talk['title']}\"")
-                else:
-                    user_input = input(f"No newsroom summary found for \"{talk['title']}\". Enter manual URL or press Enter to skip: ").strip()
-                    if user_input:
-                        if conference_key not in output_resources:
-                            output_resources[conference_key] = {}
-                        output_resources[conference_key][talk_key] = {
-                            **output_resources[conference_key].get(talk_key, {}),
-                            "Church News Summary": user_input
-                        }
-                        print(f"Added manual newsroom summary for \"{talk['title']}\"")
-                break
-        if found:
-            break
-    if not found:
+    talk = build_title_index(conference_data).get(target_title.casefold())
+    if talk is None:
         print(f"Talk with title \"{target_title}\" not found.")
+        return
+    talk_key = get_talk_key(talk, year, month)
+    
+    # Check if already exists
+    if output_resources.get(conference_key, {}).get(talk_key, {}).get("Church News Summary") and not manual_url:
+        print(f"Newsroom summary already present for \"{talk['title']}\". Skipping.")
+        return
+    
+    url = manual_url
+    if not url:
+        url = find_newsroom_summary_url_with_retry(talk['title'], talk['speaker'], talk['speaker_role'], year, month)
+    
+    if url:
+        set_resource(output_resources, conference_key, talk_key, "Church News Summary", url)
+        print(f"Added newsroom summary for \"{talk['title']}\"")
+    else:
+        user_input = input(f"No newsroom summary found for \"{talk['title']}\". Enter manual URL or press Enter to skip: ").strip()
+        if user_input:
+            set_resource(output_resources, conference_key, talk_key, "Church News Summary", user_input)
+            print(f"Added manual newsroom summary for \"{talk['title']}\"")
 
-def process_all_talks(conference_data, output_resources):
+def process_all_talks(conference_data, output_resources, output_file=None, batch_size=1):
     year = conference_data.get('year')
     month = conference_data.get('month')
     conference_key = f"{year}-{month.replace(' ', '-').title()}"
@@ -162,52 +382,87 @@ def process_all_talks(conference_data, output_resources):
         print("No talks found in JSON.")
         return
     
-    # Filter talks that need processing
+    # Key every talk once and keep only those still missing a summary
+    existing = output_resources[conference_key]
     talks_to_process = []
     for talk in all_talks:
         talk_key = get_talk_key(talk, year, month)
-        if "Church News Summary" not in output_resources[conference_key].get(talk_key, {}):
-            talks_to_process.append(talk)
+        if "Church News Summary" not in existing.get(talk_key, {}):
+            talks_to_process.append((talk, talk_key))
     
     print(f'Adding newsroom summaries to {len(talks_to_process)} talks:')
     with tqdm(total=len(talks_to_process), desc="Processing talks") as pbar:
         with ThreadPoolExecutor(max_workers=20) as executor:
-            # Submit all futures first
-            future_to_talk = {}
-            for talk in talks_to_process:
-                future = executor.submit(
-                    find_newsroom_summary_url_with_retry, 
-                    talk['title'], talk['speaker'], talk['speaker_role'], year, month
-                )
-                future_to_talk[future] = talk  # Store mapping future -> talk
+            # Group talk keys by unique query so duplicates share one lookup
+            talks_by_query = {}
+            for talk, talk_key in talks_to_process:
+                query = (talk['title'], talk['speaker'], talk['speaker_role'], year, month)
+                talks_by_query.setdefault(query, []).append(talk_key)
             
-            # Process completed futures
-            for future in as_completed(future_to_talk):
-                talk = future_to_talk[future]
-                talk_key = get_talk_key(talk, year, month)
-                url = future.result()
-                pbar.update(1)
-                
-                if url:
-                    output_resources[conference_key][talk_key] = {
-                        **output_resources[conference_key].get(talk_key, {}),
-                        "Church News Summary": url
-                    }
+            # Submit one future per query, or per batch of queries when batching prompts
+            queries = list(talks_by_query)
+            future_to_queries = {}
+            if batch_size > 1:
+                for i in range(0, len(queries), batch_size):
+                    batch = queries[i:i + batch_size]
+                    future_to_queries[executor.submit(find_newsroom_urls_batch, batch)] = batch
+            else:
+                for query in queries:
+                    future_to_queries[executor.submit(find_newsroom_summary_url_with_retry, *query)] = [query]
+            
+            # Process completed futures, checkpointing so an interrupted run keeps paid-for results
+            completed_since_save = 0
+            try:
+                for future in as_completed(future_to_queries):
+                    batch = future_to_queries[future]
+                    urls = future.result() if batch_size > 1 else [future.result()]
+                    for query, url in zip(batch, urls):
+                        talk_keys = talks_by_query[query]
+                        pbar.update(len(talk_keys))
+                        if url:
+                            for talk_key in talk_keys:
+                                set_resource(output_resources, conference_key, talk_key, "Church News Summary", url)
+                    
+                    completed_since_save += 1
+                    if output_file and completed_since_save >= CHECKPOINT_EVERY:
+                        save_resources(output_resources, output_file)
+                        completed_since_save = 0
+            except KeyboardInterrupt:
+                # Drop queued lookups so the executor doesn't wait on them before the caller saves
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
     
     # Handle misses interactively
-    misses = []
-    for talk in talks_to_process:
-        talk_key = get_talk_key(talk, year, month)
-        if "Church News Summary" not in output_resources[conference_key].get(talk_key, {}):
-            misses.append((talk, talk_key))
+    misses = [(talk, talk_key) for talk, talk_key in talks_to_process if "Church News Summary" not in existing.get(talk_key, {})]
     
-    for talk, talk_key in misses:
-        user_input = input(f"No newsroom summary found for \"{talk['title']}\". Enter manual URL or press Enter to skip: ").strip()
-        if user_input:
-            output_resources[conference_key][talk_key] = {
-                **output_resources[conference_key].get(talk_key, {}),
-                "Church News Summary": user_input
-            }
+    if not misses:
+        return
+    
+    # Run broader searches in the background while the user works through the prompts
+    executor = ThreadPoolExecutor(max_workers=20)
+    try:
+        broad_futures = {}
+        for talk, talk_key in misses:
+            future = executor.submit(
+                find_newsroom_summary_url_broad,
+                talk['title'], talk['speaker'], talk['speaker_role'], year, month
+            )
+            # Cache finds as they land, so a search still running when its prompt came up isn't paid for again next run
+            cache_key = get_cache_key(talk['title'], talk['speaker'], year, month)
+            future.add_done_callback(lambda f, cache_key=cache_key: cache_broad_result(f, cache_key))
+            broad_futures[talk_key] = future
+        for talk, talk_key in misses:
+            future = broad_futures[talk_key]
+            auto_url = future.result() if future.done() else None
+            if auto_url:
+                user_input = input(f"Broader search found {auto_url} for \"{talk['title']}\". Press Enter to keep it or enter a manual URL: ").strip()
+                user_input = user_input or auto_url
+            else:
+                user_input = input(f"No newsroom summary found for \"{talk['title']}\". Enter manual URL or press Enter to skip: ").strip()
+            if user_input:
+                set_resource(output_resources, conference_key, talk_key, "Church News Summary", user_input)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == '__main__':
     import argparse
@@ -215,11 +470,11 @@ if __name__ == '__main__':
     parser.add_argument('json_file', help='Path to the input JSON file')
     parser.add_argument('--talk', help='Title of the single talk to process')
     parser.add_argument('--manual', help='Manual URL to add for the talk (if --talk is specified)')
+    parser.add_argument('--batch-size', type=int, default=1, help='Number of talks to look up per Grok request (default 1)')
     args = parser.parse_args()
     
     try:
-        with open(args.json_file, 'r') as f:
-            conference_data = json.load(f)
+        conference_data = load_json(args.json_file)
     except Exception as e:
         print(f"Error loading JSON: {e}")
         sys.exit(1)
@@ -227,19 +482,22 @@ if __name__ == '__main__':
     # Load existing conference_resources.json or create new
     output_file = 'conference_resources.json'
     try:
-        with open(output_file, 'r') as f:
-            output_resources = json.load(f)
+        output_resources = load_json(output_file)
     except FileNotFoundError:
         output_resources = {}
     
-    if args.talk:
-        process_single_talk(conference_data, args.talk, args.manual, output_resources)
-    else:
-        process_all_talks(conference_data, output_resources)
+    try:
+        if args.talk:
+            process_single_talk(conference_data, args.talk, args.manual, output_resources)
+        else:
+            process_all_talks(conference_data, output_resources, output_file, args.batch_size)
+    except KeyboardInterrupt:
+        save_resources(output_resources, output_file)
+        print(f"\nInterrupted. Progress saved to {output_file}")
+        sys.exit(130)
     
     # Save to conference_resources.json
-    with open(output_file, 'w') as f:
-        json.dump(output_resources, f, indent=2)
+    save_resources(output_resources, output_file)
     print(f"Updated resources saved to {output_file}")
     
     # Show example of output structure
@@ -6,6 +6,13 @@ with resource links and AI-generated summaries. It ensures that existing verse c
 import os
 import json
 import re
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import orjson  # optional: parses the multi-MB volume files several times faster than json
+except ImportError:
+    orjson = None
 
 # Define the lists of books for each category in their standard order
 ot_books = [
@@ -49,6 +56,15 @@ book_orders = {
     "Doctrine and Covenants": dc_books
 }
 
+# Book name -> 1-based position, so each book's folder number is a dict lookup
+book_index_maps = {
+    category: {name: i + 1 for i, name in enumerate(order)}
+    for category, order in book_orders.items()
+}
+
+# Threads per volume process for the chapter reads/writes (I/O-bound, so they overlap well)
+WRITER_THREADS = 16
+
 tag_map = {
     "Old Testament": "Scripture/OT",
     "New Testament": "Scripture/NT",
@@ -57,14 +73,55 @@ tag_map = {
     "Pearl of Great Price": "Scripture/PoGP"
 }
 
-# Function to clean name for front matter key
+# Function to clean name for front matter key (a one-pass translate, memoized since resource names repeat every chapter)
+CLEAN_KEY_TABLE = str.maketrans({' ': '_', '-': '_', "'": None, '(': None, ')': None})
+
+@lru_cache(maxsize=1024)
 def clean_key(name):
-    return name.lower().replace(' ', '_').replace('-', '_').replace('--', '_').replace("'", "").replace('(', '').replace(')', '')
+    return name.lower().translate(CLEAN_KEY_TABLE)
+
+# Compiled once: checked against every resource name of every chapter
+CFM_YEAR_RE = re.compile(r"CFM (\d{4})")
+
+# Function to get the front matter key for a resource (all CFM years share the cfm_<year>_url form)
+@lru_cache(maxsize=1024)
+def resource_key(name):
+    match = CFM_YEAR_RE.match(name)
+    if match:
+        return f"cfm_{match.group(1)}_url"
+    return clean_key(name) + "_url"
+
+# Frontmatter opening that only depends on the volume, built once per category
+FRONTMATTER_BASE = "---\npublish: true\ntags:\n  - no-graph\n"
+FRONTMATTER_CSS = "cssclasses:\n  - scriptures\n"
+FRONTMATTER_PREFIXES = {category: f"{FRONTMATTER_BASE}  - {tag}\n{FRONTMATTER_CSS}" for category, tag in tag_map.items() if tag}
+
+# Per-chapter frontmatter fields, filled in one format_map call
+FRONTMATTER_TEMPLATE = (
+    "context_summary: {context_summary}\n"
+    "child_summary: {child_summary}\n"
+    "summary: {summary}\n"
+    "volume: {volume}\n"
+    "book: {book}\n"
+    "book_number: {book_number}\n"
+    "chapter: {chapter}\n"
+)
+
+# Function to generate the AI summary callouts (memoized, chapters without summaries all share the "NA" block)
+@lru_cache(maxsize=4096)
+def generate_ai_block(context_summary, child_summary, normal_summary, tags):
+    return (
+        f">>[!AI]- AI Context\n"
+        f">>{context_summary}\n>\n"
+        f">>[!AI]- AI Child Summary\n"
+        f">>{child_summary}\n>\n"
+        f">>[!AI]- AI Summary\n"
+        f">>{normal_summary}\n"
+        f">\n>{tags}\n"
+    )
 
 # Function to generate the top portion (frontmatter and callouts)
 def generate_top_portion(resources_list, category, ai_resources, book_name, chapter_num, book_number):
-    tag = tag_map.get(category, "")
-
     # Handle AI summaries
     if ai_resources:
         context_summary = ai_resources.get("context_summary", "NA")
@@ -77,119 +134,121 @@ def generate_top_portion(resources_list, category, ai_resources, book_name, chap
         normal_summary = "NA"
         tags = ""
 
-    top_content = "---\n"
-    top_content += "publish: true\n"
-    top_content += "tags:\n"
-    top_content += "  - no-graph\n"
-    if tag:
-        top_content += f"  - {tag}\n"
-    top_content += "cssclasses:\n"
-    top_content += "  - scriptures\n"
-    top_content += f"context_summary: {context_summary}\n"
-    top_content += f"child_summary: {child_summary}\n"
-    top_content += f"summary: {normal_summary}\n"
-    top_content += f"volume: {category}\n"
-    top_content += f"book: {book_name}\n"
-    top_content += f"book_number: {book_number}\n"
-    top_content += f"chapter: {chapter_num}\n"
+    parts = [FRONTMATTER_PREFIXES.get(category, FRONTMATTER_BASE + FRONTMATTER_CSS)]
+    parts.append(FRONTMATTER_TEMPLATE.format_map({
+        "context_summary": context_summary,
+        "child_summary": child_summary,
+        "summary": normal_summary,
+        "volume": category,
+        "book": book_name,
+        "book_number": book_number,
+        "chapter": chapter_num,
+    }))
+    # Pull each resource's name, url and key once for both the front matter and the link line
+    prepared = [(res["name"], res["url"], resource_key(res["name"])) for res in resources_list]
+
     # Loop through resources to add to front matter
-    for res in resources_list:
-        if res["name"].startswith("CFM "):
-            match = re.search(r"CFM (\d{4})", res["name"])
-            if match:
-                year = match.group(1)
-                key = f"cfm_{year}_url"
-            else:
-                key = clean_key(res["name"]) + "_url"
-        else:
-            key = clean_key(res["name"]) + "_url"
-        top_content += f"{key}: {res['url']}\n"
-    top_content += "---\n"
+    for name, url, key in prepared:
+        parts.append(f"{key}: {url}\n")
+    parts.append("---\n")
 
     # Write chapter details with hyperlinks
-    top_content += ">[!Properties]+ Resources\n"
-    links = "    |    ".join(f"[{res['name']}]({res['url']})" for res in resources_list)
-    top_content += f">{links}\n"
+    links = "    |    ".join(f"[{name}]({url})" for name, url, _ in prepared)
+    parts.append(f">[!Properties]+ Resources\n>{links}\n")
 
     # Write AI summaries
-    top_content += ">>[!AI]- AI Context\n"
-    top_content += f">>{context_summary}\n>\n"
-    top_content += ">>[!AI]- AI Child Summary\n"
-    top_content += f">>{child_summary}\n>\n"
-    top_content += ">>[!AI]- AI Summary\n"
-    top_content += f">>{normal_summary}\n"
-    top_content += f">\n>{tags}\n"
-    return top_content
-
-# Function to generate verses content (for new files)
+    parts.append(generate_ai_block(context_summary, child_summary, normal_summary, tags))
+    return "".join(parts)
+
+# Function to generate verses content (for new files) from (number, text) pairs already in verse order
 def generate_verses(verses):
-    verses_content = ""
-    for verse_num in sorted(verses.keys()):
-        verse_text = verses[verse_num]
-        verses_content += f"###### {verse_num}\n"
-        verses_content += f"{verse_num} {verse_text}\n"
-    return verses_content
+    return "".join(f"###### {verse_num}\n{verse_num} {verse_text}\n" for verse_num, verse_text in verses)
 
 # Function to update a chapter file
-def update_chapter_file(file_path, verses, resources_list, category, ai_resources, book_name, chapter_num, book_number):
+def update_chapter_file(file_path, verses, resources_list, category, ai_resources, book_name, chapter_num, book_number, file_exists):
     top_content = generate_top_portion(resources_list, category, ai_resources, book_name, chapter_num, book_number)
 
-    if os.path.exists(file_path):
-        with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
-        
-        # Find the index of the line starting with "###### 1"
+    existing = None
+    if file_exists:
+        with open(file_path, "rb") as f:
+            existing = f.read()
+
+        # Find the start of the first line beginning with "###### 1" straight in the byte buffer
         verse_start_index = None
-        for i, line in enumerate(lines):
-            if line.strip().startswith("###### 1"):
-                verse_start_index = i
+        idx = existing.find(b"###### 1")
+        while idx >= 0:
+            line_start = existing.rfind(b"\n", 0, idx) + 1
+            if not existing[line_start:idx].decode("utf-8").strip():
+                verse_start_index = line_start
                 break
+            idx = existing.find(b"###### 1", idx + 1)
         
         if verse_start_index is not None:
-            preserved_content = "".join(lines[verse_start_index:])
+            # Kept as bytes: the preserved verses are written back exactly as read, with no decode/encode pass
+            preserved_content = existing[verse_start_index:]
         else:
             # If no ###### 1 found, treat as new or preserve nothing; here we generate verses
-            preserved_content = generate_verses(verses)
+            preserved_content = generate_verses(verses).encode("utf-8")
     else:
         # If file doesn't exist, generate full content
-        preserved_content = generate_verses(verses)
+        preserved_content = generate_verses(verses).encode("utf-8")
+
+    # Skip unchanged files so re-runs don't touch every note (and its mtime) in the vault
+    payload = top_content.encode("utf-8") + preserved_content
+    if payload == existing:
+        return
 
-    # Write the updated content
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(top_content)
-        f.write(preserved_content)
+    # Write the updated content as one encoded buffer in a single write call
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-# Process each category
-for category, json_filename in json_files.items():
+# Function to create/update every chapter file for one volume
+def process_category(category, json_filename):
     json_file = os.path.join("lds_scriptures_json", json_filename)
-    with open(json_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        books_list = data.get(category, [])  # List of book dicts
+    with open(json_file, "rb") as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    books_list = data.get(category, [])  # List of book dicts
+    chapter_tasks = []  # Argument tuples for update_chapter_file, run on the writer threads below
+    folder_listings = {}  # Folder path -> names already in it (D&C books share one folder)
 
     for book_dict in books_list:
         book_name = book_dict["name"]
         if category != "Doctrine and Covenants":
-            order_list = book_orders[category]
-            try:
-                book_index = order_list.index(book_name.replace("--", "—")) + 1
-            except ValueError:
-                try:
-                    book_index = order_list.index(book_name) + 1
-                except ValueError:
-                    print(f"Warning: Book '{book_name}' not found in order list for {category}.")
-                    continue
+            index_map = book_index_maps[category]
+            book_index = index_map.get(book_name.replace("--", "—")) or index_map.get(book_name)
+            if book_index is None:
+                print(f"Warning: Book '{book_name}' not found in order list for {category}.")
+                continue
             book_for_folder = book_name.replace("—", "--")
             full_book_folder = os.path.join("Scriptures", category, f"{book_index:02d} {book_for_folder}")
-            os.makedirs(full_book_folder, exist_ok=True)
             book_fm = book_name
             book_number = book_index
         else:
             full_book_folder = os.path.join("Scriptures", category)
-            os.makedirs(full_book_folder, exist_ok=True)
+
+        # List the folder once rather than stat-ing every chapter file; only create it when it is missing
+        existing_files = folder_listings.get(full_book_folder)
+        if existing_files is None:
+            try:
+                with os.scandir(full_book_folder) as entries:
+                    existing_files = {entry.name for entry in entries}
+            except FileNotFoundError:
+                os.makedirs(full_book_folder, exist_ok=True)
+                existing_files = set()
+            folder_listings[full_book_folder] = existing_files
 
         for chapter_dict in book_dict["chapters"]:
             chapter_num = chapter_dict["number"]
-            verses = {v["number"]: v["text"] for v in chapter_dict["verses"]}
+            verses = [(v["number"], v["text"]) for v in chapter_dict["verses"]]  # The JSON lists verses in order
+            # Not sorted or de-duplicated here, so catch a mis-ordered volume rather than write scrambled chapters (skipped under -O)
+            assert all(prev[0] < cur[0] for prev, cur in zip(verses, verses[1:])), \
+                f"{book_name} {chapter_num}: verse numbers are out of order or repeated"
             resources_list = chapter_dict.get("chapter_resources", [])
             ai_resources = chapter_dict.get("ai_resources", None)
 
@@ -212,6 +271,15 @@ for category, json_filename in json_files.items():
                 file_name = f"{book_for_folder} {chapter_num}.md"
 
             file_path = os.path.join(full_book_folder, file_name)
-            update_chapter_file(file_path, verses, resources_list, category, ai_resources, book_fm, chapter_fm, book_number)
+            chapter_tasks.append((file_path, verses, resources_list, category, ai_resources, book_fm, chapter_fm, book_number, file_name in existing_files))
+
+    # Each chapter file is independent, so overlap their open/read/write syscalls
+    with ThreadPoolExecutor(max_workers=WRITER_THREADS) as executor:
+        list(executor.map(lambda args: update_chapter_file(*args), chapter_tasks))
+
+if __name__ == "__main__":
+    # Volumes are independent, so parse and write each one in its own process
+    with ProcessPoolExecutor(max_workers=len(json_files)) as executor:
+        list(executor.map(process_category, json_files.keys(), json_files.values()))
 
-print("Scripture files have been updated successfully.")
\ No newline at end of file
+    print("Scripture files have been updated successfully.")
@@ -7,16 +7,31 @@ Sample Usage:
 - To scrape a single talk:
   python website_scraper.py https://www.churchofjesuschrist.org/study/general-conference/2023/10/12nelson?lang=eng
   (This will scrape the individual talk, determine the conference, and add/update it in the corresponding conference JSON file like 'conference_json/2023-october.json'. If the file doesn't exist, it will create it with just that talk.)
+
+- To backfill many single talks in one process (talk URLs on stdin, one per line):
+  python website_scraper.py --serve < talk_urls.txt
+  (The chromedriver lookup, cached conference indexes and HTTP connections stay warm across talks; each talk is saved as soon as it is scraped.)
+
+- Talk pages are cached in .scrape_cache for a week; add --no-cache to either command to fetch everything fresh.
 """
 
 import os
 import json
 import time
+import random
 import sys
 import re
-from urllib.parse import urlparse
+import shelve
+import atexit
+import threading
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qs, urljoin
+import requests
+import lxml.html
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
@@ -24,14 +39,54 @@ from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 from tqdm import tqdm
 from dotenv import load_dotenv
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson  # optional: much faster JSON parsing for the conference files
+except ImportError:
+    orjson = None
 
 # Load .env from current directory (start dir)
 load_dotenv()
 
+# Site root that relative hrefs on the Gospel Library pages are resolved against
+BASE_URL = 'https://www.churchofjesuschrist.org'
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Retry settings for transient talk-fetch failures (jittered exponential backoff)
+MAX_RETRIES = 3
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 30.0
+TRANSIENT_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Shared HTTP session: pooled keep-alive connections to churchofjesuschrist.org for the talk pages.
+# No adapter-level retries: scrape_talk_with_retry is the single retry layer
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = USER_AGENT
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# On-disk cache of fetched talk pages so re-runs don't re-download them (skip with --no-cache)
+CACHE_FILE = '.scrape_cache'
+CACHE_TTL = 7 * 24 * 60 * 60  # talks are occasionally corrected after publication, so refetch weekly
+_cache = shelve.open(CACHE_FILE)
+_cache_lock = threading.Lock()
+atexit.register(_cache.close)
+use_cache = True
+
+# Talks scraped concurrently per conference (override with SCRAPE_WORKERS in .env)
+SCRAPE_WORKERS = int(os.getenv('SCRAPE_WORKERS', '16'))
+
+# Save the partially scraped conference every this many finished talks
+CHECKPOINT_EVERY = 5
+
 # Create conference_json directory if it doesn't exist
 JSON_DIR = 'conference_json'
 os.makedirs(JSON_DIR, exist_ok=True)
+RESOURCES_FILE = os.path.join(JSON_DIR, 'conference_resources.json')
+
+# conference_resources.json is read once per run and written back once by flush_conference_resources
+_resources = None
+_resources_dirty = False
 
 # Book map for scripture abbreviations to full names
 book_map = {
@@ -129,12 +184,40 @@ book_map = {
     'pgp/a-of-f': 'Articles of Faith',
 }
 
-def get_wikilink(href, text):
+# Same map split by corpus, so a link's (corpus, book) pair is looked up without building a key string
+book_map_by_corpus = {}
+for key, name in book_map.items():
+    corpus, book_abbr = key.split('/')
+    book_map_by_corpus.setdefault(corpus, {})[book_abbr] = name
+
+# Regexes compiled once at import; they run per link, per talk and per index entry
+BY_RE = re.compile(r'By\s+', re.IGNORECASE)
+SPEAKER_TITLE_RE = re.compile(r'^(Elder|President|Sister|Brother)\s+', re.IGNORECASE)
+ROLE_OF_THE_RE = re.compile(r'^Of the ', re.IGNORECASE)
+# Every role variant in one alternation; the named group that matched picks the canonical name
+ROLE_RE = re.compile(
+    r'(?P<twelve>Quorum of the (?:Twelve|twelve|12) Apostles|Q_of_12|Council of the 12)'
+    r'|(?P<seventy>Q_of_70|70|First Council of the Seventy|Presidency of the First Q_of_70|Emeritus member of the Seventy|Released Member of the Seventy|Former member of the Seventy)'
+    r'|(?P<president>President of The Church of Jesus Christ of Latter-day Saints|President of the Church)',
+    re.IGNORECASE,
+)
+ROLE_CANONICAL = {'twelve': 'Quorum of the 12', 'seventy': 'Seventy', 'president': 'President of the Church'}
+TALK_ID_RE = re.compile(r'/general-conference/(\d{4})/(\d{2})/([a-z0-9]+)')
+CONFERENCE_URL_RE = re.compile(r'/general-conference/(\d{4})/(\d{2})/')
+FILENAME_UNSAFE_RE = re.compile(r'[^a-z0-9\- ]', re.IGNORECASE)
+
+def strip_verse_prefix(part):
+    """Drop the leading 'p' of a paragraph id like 'p12' (a plain slice, no regex needed)"""
+    return (part[1:] if part[:1] in ('p', 'P') else part).strip()
+
+@lru_cache(maxsize=4096)
+def parse_scripture_link(href):
+    """Return (page_name, verses) for a scripture URL, or None if it isn't one; cached since talks cite the same verses"""
     try:
-        parsed_url = urlparse(href)
+        parsed_url = urlsplit(href)
         if not parsed_url.path.startswith('/study/scriptures/'):
             return None
-        parts = parsed_url.path.split('/')[3:]  # after /study/scriptures/
+        parts = parsed_url.path.split('/', 6)[3:]  # after /study/scriptures/ (corpus, book, chapter)
         if len(parts) < 2:
             return None
         corpus = parts[0]
@@ -143,91 +226,118 @@ def get_wikilink(href, text):
         if len(parts) > 2:
             chapter = parts[2]
         verses_str = ''
-        if 'id' in parsed_url.query:
-            query_params = dict(q.split('=') for q in parsed_url.query.split('&'))
-            verses_str = query_params.get('id', '')
+        query_params = parse_qs(parsed_url.query)
+        if 'id' in query_params:
+            verses_str = query_params['id'][0]
         elif parsed_url.fragment:
             verses_str = parsed_url.fragment[1:]
         verses_str = verses_str.lower()
         # Remove 'p' from the beginning case-insensitively
-        verses_str = re.sub(r'^p', '', verses_str)
-        key = f"{corpus}/{book_abbr}"
-        book_name = book_map.get(key)
+        verses_str = strip_verse_prefix(verses_str)
+        book_name = book_map_by_corpus.get(corpus, {}).get(book_abbr)
         if not book_name:
             return None
         page_name = f"D&C {chapter}" if book_name == 'D&C' else f"{book_name} {chapter}"
         if not verses_str:
-            return f"[[{page_name}|{text}]]"
+            return page_name, ()
         verse_parts = verses_str.split(',')
         all_verses = []
         for part in verse_parts:
             part = part.strip()
             if '-' in part:
                 range_parts = part.split('-')
-                start = re.sub(r'^p', '', range_parts[0], flags=re.IGNORECASE).strip()
-                end = re.sub(r'^p', '', range_parts[1], flags=re.IGNORECASE).strip() if len(range_parts) > 1 else ''
+                start = strip_verse_prefix(range_parts[0])
+                end = strip_verse_prefix(range_parts[1]) if len(range_parts) > 1 else ''
                 start_num = int(start) if start else None
                 end_num = int(end) if end else None
                 if start_num is not None and end_num is not None:
                     all_verses.extend(range(start_num, end_num + 1))
             else:
-                part_num = re.sub(r'^p', '', part, flags=re.IGNORECASE).strip()
+                part_num = strip_verse_prefix(part)
                 if part_num:
                     all_verses.append(int(part_num))
-        if not all_verses:
-            return f"[[{page_name}|{text}]]"
-        md = f"[[{page_name}#{all_verses[0]}|{text}]]"
-        for v in all_verses[1:]:
-            md += f"[[{page_name}#{v}|]]"
-        return md
+        return page_name, tuple(all_verses)
     except Exception as e:
         print(f"Error parsing scripture link: {e}")
         return None
 
-def html_to_markdown(html, is_source=False):
-    # Handle emphasis and bold
-    html = re.sub(r'<em>(.*?)</em>', r'*\1*', html, flags=re.IGNORECASE | re.DOTALL)
-    html = re.sub(r'<i>(.*?)</i>', r'*\1*', html, flags=re.IGNORECASE | re.DOTALL)
-    html = re.sub(r'<strong>(.*?)</strong>', r'**\1**', html, flags=re.IGNORECASE | re.DOTALL)
-    html = re.sub(r'<b>(.*?)</b>', r'**\1**', html, flags=re.IGNORECASE | re.DOTALL)
-    # Remove spans
-    html = re.sub(r'<span[^>]*>(.*?)</span>', r'\1', html, flags=re.IGNORECASE | re.DOTALL)
+def get_wikilink(href, text):
+    parsed = parse_scripture_link(href)
+    if not parsed:
+        return None
+    page_name, verses = parsed
+    if not verses:
+        return f"[[{page_name}|{text}]]"
+    # One join for the hidden per-verse links rather than growing a string verse by verse
+    page_prefix = f"[[{page_name}#"
+    return f"{page_prefix}{verses[0]}|{text}]]" + ''.join([f"{page_prefix}{v}|]]" for v in verses[1:]])
+
+# Inline tags rendered as markdown emphasis
+MARKDOWN_WRAPPERS = {'em': '*', 'i': '*', 'strong': '**', 'b': '**'}
+# lxml decodes entities, but the saved markdown has always kept them the way the browser's innerHTML serializes them
+INNER_HTML_TEXT_ESCAPES = str.maketrans({'&': '&amp;', '\xa0': '&nbsp;', '<': '&lt;', '>': '&gt;'})
+INNER_HTML_ATTR_ESCAPES = str.maketrans({'&': '&amp;', '\xa0': '&nbsp;', '"': '&quot;'})
+
+def node_to_markdown(node, is_source=False):
+    """Markdown for one lxml node, including its own tag (but not its tail)"""
+    tag = node.tag
+    if not isinstance(tag, str):
+        return ''  # Comments and processing instructions
+    tag = tag.lower()
     # Handle footnotes sup
-    html = re.sub(r'<sup[^>]*><a[^>]+href="#([^"]+)"[^>]*>([^<]+)</a></sup>', r'[^ \1]', html, flags=re.IGNORECASE | re.DOTALL)
-    # Remove backrefs in sources
-    if is_source:
-        html = re.sub(r'<a[^>]+class="backref"[^>]*>.*?</a>', '', html, flags=re.IGNORECASE | re.DOTALL)
-    # Handle links
-    def link_repl(match):
-        href = match.group(1)
-        text = match.group(2)
-        abs_href = href if href.startswith('http') else f"https://www.churchofjesuschrist.org{href}"
+    if tag == 'sup' and len(node) and node[0].tag == 'a':
+        href = node[0].get('href', '')
+        if href.startswith('#') and node[0].text_content():
+            return f"[^ {href[1:].translate(INNER_HTML_ATTR_ESCAPES)}]"
+    if tag == 'a':
+        # Remove backrefs in sources
+        if is_source and 'backref' in node.get('class', '').split():
+            return ''
+        href = node.get('href')
+        text = children_to_markdown(node, is_source)
+        if not href or not text:
+            return text
+        # Handle links
+        abs_href = href if href.startswith('http') else f"{BASE_URL}{href}"
         wiki = get_wikilink(abs_href, text)
         if wiki:
             return wiki
-        return f"[{text}]({abs_href})"
-    html = re.sub(r'<a[^>]+href="([^"]+)"[^>]*>([^<]+)</a>', link_repl, html, flags=re.IGNORECASE | re.DOTALL)
-    # Strip remaining tags
-    html = re.sub(r'<[^>]+>', '', html)
-    return html.strip()
+        return f"[{text}]({abs_href.translate(INNER_HTML_ATTR_ESCAPES)})"
+    inner = children_to_markdown(node, is_source)
+    wrapper = MARKDOWN_WRAPPERS.get(tag)
+    if wrapper:
+        return f"{wrapper}{inner}{wrapper}"
+    # Spans and every other tag are unwrapped to their contents
+    return inner
+
+def children_to_markdown(element, is_source=False):
+    """Markdown for the contents of an lxml element (its text and children, not its own tag)"""
+    parts = [(element.text or '').translate(INNER_HTML_TEXT_ESCAPES)]
+    for child in element:
+        parts.append(node_to_markdown(child, is_source))
+        parts.append((child.tail or '').translate(INNER_HTML_TEXT_ESCAPES))
+    return ''.join(parts)
+
+def element_to_markdown(element, is_source=False):
+    if not len(element):
+        return (element.text or '').translate(INNER_HTML_TEXT_ESCAPES).strip()  # Plain-text paragraph: nothing to walk
+    return children_to_markdown(element, is_source).strip()
 
 def normalize_speaker(speaker):
-    speaker = re.sub(r'By\s+', '', speaker, flags=re.IGNORECASE)
-    speaker = re.sub(r'^(Elder|President|Sister|Brother)\s+', '', speaker, flags=re.IGNORECASE)
+    speaker = BY_RE.sub('', speaker)
+    speaker = SPEAKER_TITLE_RE.sub('', speaker)
     return speaker.strip()
 
 def normalize_role(role):
     if not role:
         return None
-    role = re.sub(r'^Of the ', '', role, flags=re.IGNORECASE).strip()
-    role = re.sub(r'Quorum of the (Twelve|twelve|12) Apostles|Q_of_12|Council of the 12', 'Quorum of the 12', role, flags=re.IGNORECASE)
-    role = re.sub(r'Q_of_70|70|Assistant to the Q_of_12|First Council of the Seventy|Presidency of the First Q_of_70|Emeritus member of the Seventy|Released Member of the Seventy|Former member of the Seventy', 'Seventy', role, flags=re.IGNORECASE)
-    role = re.sub(r'President of The Church of Jesus Christ of Latter-day Saints|President of the Church', 'President of the Church', role, flags=re.IGNORECASE)
-    return role
+    role = ROLE_OF_THE_RE.sub('', role).strip()
+    return ROLE_RE.sub(lambda match: ROLE_CANONICAL[match.lastgroup], role)
 
+@lru_cache(maxsize=4096)
 def get_talk_id_from_url(url):
-    """Extract talk ID from URL like '2023/10/12nelson' - uses URL month code (04/10)"""
-    match = re.search(r'/general-conference/(\d{4})/(\d{2})/([a-z0-9]+)', url)
+    """Extract talk ID from URL like '2023/10/12nelson' - uses URL month code (04/10). Memoized, every resource save re-derives the same IDs"""
+    match = TALK_ID_RE.search(url)
     if match:
         year = match.group(1)
         month_code = match.group(2)  # 04 or 10 from URL
@@ -235,6 +345,31 @@ def get_talk_id_from_url(url):
         return f"{year}/{month_code}/{talk_id}"
     return None
 
+def get_last_segment(url):
+    """Final path segment of a URL without its query, e.g. '12nelson' (no throwaway split lists)"""
+    start = url.rfind('/') + 1
+    end = url.find('?', start)
+    return url[start:end] if end != -1 else url[start:]
+
+def load_json(path):
+    if orjson:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_json(data, path):
+    """Write to a temp file and swap it in so an interrupted save never leaves a truncated JSON file"""
+    tmp_file = path + '.tmp'
+    # Always the stdlib writer: orjson would rewrite the committed files' \uXXXX escapes as raw UTF-8 on every save
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_file, path)
+
+def is_talk_segment(segment):
+    """True for talk slugs like '12nelson' (two digits then letters); session slugs don't fit. Plain str checks, no regex"""
+    return len(segment) > 2 and segment[:2].isdecimal() and segment[2:].isascii() and segment[2:].isalpha()
+
 def get_conference_sort_key(item):
     """Get sort key for chronological ordering: (year, month_num) - item is (key, value) tuple"""
     conf_key = item[0]  # Extract the key string from the tuple
@@ -243,41 +378,70 @@ def get_conference_sort_key(item):
     month_num = 4 if month_str == 'April' else 10
     return (year, month_num)
 
+def get_conference_resources():
+    """The parsed conference_resources.json, loaded on first use and shared for the rest of the run"""
+    global _resources
+    if _resources is None:
+        _resources = load_json(RESOURCES_FILE) if os.path.exists(RESOURCES_FILE) else {}
+    return _resources
+
+def flush_conference_resources():
+    """Write conference_resources.json if anything was added since the last flush"""
+    global _resources_dirty
+    if not _resources_dirty:
+        return
+    save_json(_resources, RESOURCES_FILE)
+    _resources_dirty = False
+    print(f"Saved Gospel Library URLs to {RESOURCES_FILE}")
+
+atexit.register(flush_conference_resources)
+
 def save_conference_resources(conference_data, year, month):
-    """Save Gospel Library URLs to conference_resources.json - chronological order, no duplicates"""
+    """Add Gospel Library URLs to conference_resources.json - chronological order, no duplicates. Written by flush_conference_resources"""
+    global _resources, _resources_dirty
     conf_key = f"{year}-{month.capitalize()}"  # 2024-October (month name)
-    resources_file = os.path.join(JSON_DIR, 'conference_resources.json')
-    
-    # Load existing resources or create new
-    if os.path.exists(resources_file):
-        with open(resources_file, 'r') as f:
-            all_resources = json.load(f)
-    else:
-        all_resources = {}
+    all_resources = get_conference_resources()
     
     # Get or create conference section (no duplicates)
-    if conf_key not in all_resources:
+    new_conference = conf_key not in all_resources
+    if new_conference:
         all_resources[conf_key] = {}
+    conference_resources = all_resources[conf_key]
     
     # Add each talk's Gospel Library URL (no duplicates) - uses URL month code
+    added = 0
     for session_name, talks in conference_data['sessions'].items():
         for talk in talks:
             talk_id = get_talk_id_from_url(talk['url'])  # 2024/10/01homer
-            if talk_id and talk_id not in all_resources[conf_key]:
-                all_resources[conf_key][talk_id] = {
+            if talk_id and talk_id not in conference_resources:
+                conference_resources[talk_id] = {
                     "Gospel Library": talk['url']
                 }
+                added += 1
     
-    # Sort conferences chronologically
-    sorted_resources = dict(sorted(all_resources.items(), key=get_conference_sort_key))
-    # Sort talks within each conference alphabetically by talk_id
-    for conf_key in sorted_resources:
-        sorted_resources[conf_key] = dict(sorted(sorted_resources[conf_key].items()))
+    # Nothing new: the resources are already up to date and sorted
+    if not new_conference and not added:
+        print(f"No new Gospel Library URLs for {conf_key}; {RESOURCES_FILE} unchanged")
+        return
     
-    # Save updated resources
-    with open(resources_file, 'w') as f:
-        json.dump(sorted_resources, f, indent=2)
-    print(f"Saved Gospel Library URLs to {resources_file}")
+    # Sort talks within this conference alphabetically by talk_id (the others are already sorted)
+    all_resources[conf_key] = dict(sorted(conference_resources.items()))
+    # Sort conferences chronologically, only needed when a conference was added
+    if new_conference:
+        _resources = dict(sorted(all_resources.items(), key=get_conference_sort_key))
+    _resources_dirty = True
+
+# Subresources Chrome never needs to fetch for the scraper
+BLOCKED_RESOURCE_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+]
+
+@lru_cache(maxsize=None)
+def get_chromedriver_path():
+    """Resolve (and download if needed) the chromedriver binary once per run"""
+    return ChromeDriverManager().install()
 
 def create_driver():
     """Create Chrome driver with proper timeout settings"""
@@ -285,101 +449,151 @@ def create_driver():
     options.add_argument('--headless')
     options.add_argument('--disable-gpu')
     options.add_argument('--no-sandbox')
-    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    service = Service(ChromeDriverManager().install())
+    options.add_argument(f'user-agent={USER_AGENT}')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    # Callers wait for the elements they need, so don't block on every subresource finishing
+    options.page_load_strategy = 'eager'
+    service = Service(get_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=options)
+    # Only the text is read: skip images, fonts and trackers (CSS stays, the lazy-loading index relies on layout)
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_PATTERNS})
     driver.set_page_load_timeout(300)
     driver.implicitly_wait(10)
     return driver
 
-def scrape_talk(url, session_name, year=None, month=None):
+def get_cached_page(url):
+    """Return the cached page body for url, or None if missing, expired or caching is off"""
+    if not use_cache:
+        return None
+    with _cache_lock:
+        entry = _cache.get(url)
+    if entry and time.time() - entry['ts'] < CACHE_TTL:
+        return entry['content']
+    return None
+
+def store_cached_page(url, content):
+    if not use_cache:
+        return
+    with _cache_lock:
+        _cache[url] = {'content': content, 'ts': time.time()}
+        _cache.sync()
+
+def fetch_page(url):
+    """Fetch a server-rendered page over the shared session (or the disk cache) and parse it with lxml"""
+    content = get_cached_page(url)
+    if content is None:
+        response = SESSION.get(url, timeout=30)
+        response.raise_for_status()
+        content = response.content
+        store_cached_page(url, content)
+    return lxml.html.fromstring(content, base_url=url)
+
+def fetch_rendered_page(url):
+    """Fallback for pages whose body only appears after JavaScript runs: render in Chrome, parse with lxml"""
     driver = create_driver()
+    try:
+        driver.get(url)
+        WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.CSS_SELECTOR, '.body-block, .body-content')))
+        return lxml.html.fromstring(driver.page_source, base_url=url)
+    finally:
+        driver.quit()
+
+def select_first(element, selector):
+    """First element matching the CSS selector, or None (lxml analogue of driver.find_element)"""
+    matches = element.cssselect(selector)
+    return matches[0] if matches else None
+
+def element_text(element):
+    """Visible-style text of an element with whitespace collapsed, like Selenium's .text"""
+    return ' '.join(element.text_content().split())
+
+def first_text(element, selector, default=None):
+    """Text of the first match under element, or default when there is none"""
+    match = select_first(element, selector)
+    return element_text(match) if match is not None else default
+
+def get_index_items(driver):
+    """The conference index entries, read from one page_source snapshot instead of per-li WebDriver calls"""
+    tree = lxml.html.fromstring(driver.page_source)
+    return tree.cssselect('ul.doc-map > li')
+
+def scroll_until_loaded(driver, max_scrolls=10):
+    """Scroll to the bottom until the page stops growing, instead of a fixed number of sleeps"""
+    height = driver.execute_script('return document.body.scrollHeight')
+    for _ in range(max_scrolls):
+        driver.execute_script('window.scrollTo(0, arguments[0]);', height)
+        try:
+            WebDriverWait(driver, 2, poll_frequency=0.2).until(
+                lambda d: d.execute_script('return document.body.scrollHeight') > height
+            )
+        except TimeoutException:
+            break
+        height = driver.execute_script('return document.body.scrollHeight')
+
+def scrape_talk(url, session_name, year=None, month=None):
     talk_data = {}
     talk_data['session'] = session_name
     talk_data['url'] = url
     try:
-        driver.get(url)
-        WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
-        time.sleep(3)
-        title_element = driver.find_element(By.TAG_NAME, 'h1')
-        talk_data['title'] = title_element.text
-        speaker_element = driver.find_element(By.CLASS_NAME, 'author-name')
-        talk_data['speaker'] = normalize_speaker(speaker_element.text)
+        # Talk pages are server-rendered, so one GET + an lxml parse replaces a headless Chrome
+        tree = fetch_page(url)
+        if select_first(tree, '.body-block, .body-content') is None:
+            # Body wasn't in the server-rendered HTML; let Chrome run the page's scripts instead
+            tree = fetch_rendered_page(url)
+        title_element = select_first(tree, 'h1')
+        talk_data['title'] = element_text(title_element)
+        speaker_element = select_first(tree, '.author-name')
+        talk_data['speaker'] = normalize_speaker(element_text(speaker_element))
         speaker_role = None
-        try:
-            role_element = driver.find_element(By.CLASS_NAME, 'author-role')
-            speaker_role = role_element.text
-        except:
-            pass
+        role_element = select_first(tree, '.author-role')
+        if role_element is not None:
+            speaker_role = element_text(role_element)
         talk_data['speaker_role'] = normalize_role(speaker_role)
         thumbnail = None
-        try:
-            thumbnail = driver.find_element(By.CSS_SELECTOR, 'img[class*="posterFallback"]').get_attribute('src')
-        except:
-            pass
-        if not thumbnail:
-            try:
-                thumbnail = driver.find_element(By.CSS_SELECTOR, 'header img, .article-header img').get_attribute('src')
-            except:
-                pass
-        if not thumbnail:
-            try:
-                thumbnail = driver.find_element(By.CSS_SELECTOR, 'img[src*="churchofjesuschrist.org/imgs"]').get_attribute('src')
-            except:
-                pass
-        if not thumbnail:
-            try:
-                thumbnail = driver.find_element(By.TAG_NAME, 'img').get_attribute('src')
-            except:
-                pass
+        for selector in ('img[class*="posterFallback"]', 'header img, .article-header img', 'img[src*="churchofjesuschrist.org/imgs"]', 'img'):
+            img = select_first(tree, selector)
+            if img is not None and img.get('src'):
+                thumbnail = urljoin(url, img.get('src'))
+                break
         talk_data['thumbnail'] = thumbnail
         subtitle = None
-        try:
-            subtitle_element = driver.find_element(By.CLASS_NAME, 'subtitle')
-            subtitle = subtitle_element.text
-        except:
-            pass
+        subtitle_element = select_first(tree, '.subtitle')
+        if subtitle_element is not None:
+            subtitle = element_text(subtitle_element)
         talk_data['subtitle'] = subtitle
         kicker = None
-        try:
-            kicker_element = driver.find_element(By.CLASS_NAME, 'kicker')
-            kicker = kicker_element.text
-        except:
-            pass
+        kicker_element = select_first(tree, '.kicker')
+        if kicker_element is not None:
+            kicker = element_text(kicker_element)
         if not kicker:
-            try:
-                kicker = driver.find_element(By.CSS_SELECTOR, '.body-block p.intro, .body-content p.intro').text
-            except:
-                pass
+            intro_element = select_first(tree, '.body-block p.intro, .body-content p.intro')
+            if intro_element is not None:
+                kicker = element_text(intro_element)
         talk_data['kicker'] = kicker
         # Find body container
-        try:
-            body_element = driver.find_element(By.CLASS_NAME, 'body-block')
-        except:
-            try:
-                body_element = driver.find_element(By.CLASS_NAME, 'body-content')
-            except Exception as e:
-                print(f"Error: Body container not found for talk at {url}: {e}")
-                return None
-        # Full markdown
-        full_html = body_element.get_attribute('innerHTML')
-        talk_data['full_markdown'] = html_to_markdown(full_html)
+        body_element = select_first(tree, '.body-block')
+        if body_element is None:
+            body_element = select_first(tree, '.body-content')
+        if body_element is None:
+            print(f"Error: Body container not found for talk at {url}")
+            return None
+        talk_data['full_markdown'] = ''  # Filled in after the body walk (keeps its place in the saved JSON)
         # Structured body
         talk_data['body'] = []
-        all_elements = body_element.find_elements(By.CSS_SELECTOR, 'h1, h2, h3, h4, h5, h6, p, figure')
+        # One document-order walk of the parsed body rather than a compiled CSS selector
+        all_elements = body_element.iter('h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'figure')
         verse = 0
         for elem in all_elements:
-            tag = elem.tag_name
-            inner_html = elem.get_attribute('innerHTML')
-            markdown = html_to_markdown(inner_html)
+            tag = elem.tag
             if tag in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
                 level = int(tag[1])
-                talk_data['body'].append({'type': 'heading', 'level': level, 'markdown': markdown})
+                talk_data['body'].append({'type': 'heading', 'level': level, 'markdown': element_to_markdown(elem)})
             elif tag == 'p':
                 this_verse = verse + 1
                 verse += 1
                 try:
-                    id_attr = elem.get_attribute('id')
+                    id_attr = elem.get('id')
                     if id_attr and id_attr.startswith('p'):
                         id_num = int(id_attr[1:])
                         if id_num:
@@ -387,32 +601,29 @@ def scrape_talk(url, session_name, year=None, month=None):
                             verse = max(verse, this_verse)
                 except:
                     pass
-                talk_data['body'].append({'verse': this_verse, 'type': 'paragraph', 'markdown': markdown})
+                talk_data['body'].append({'verse': this_verse, 'type': 'paragraph', 'markdown': element_to_markdown(elem)})
             elif tag == 'figure':
-                try:
-                    img = elem.find_element(By.TAG_NAME, 'img')
-                    src = img.get_attribute('src')
-                    alt = img.get_attribute('alt')
-                    talk_data['body'].append({'type': 'image', 'src': src, 'alt': alt})
-                except Exception as e:
-                    print(f"Error extracting image for talk at {url}: {e}")
+                img = select_first(elem, 'img')
+                if img is not None:
+                    src = img.get('src')
+                    talk_data['body'].append({'type': 'image', 'src': urljoin(url, src) if src else src, 'alt': img.get('alt')})
+                else:
+                    print(f"Error extracting image for talk at {url}: no img in figure")
+        # Full markdown, assembled from the headings and paragraphs above instead of converting the body twice
+        talk_data['full_markdown'] = '\n\n'.join(item['markdown'] for item in talk_data['body'] if 'markdown' in item)
         # Sources/footnotes
         talk_data['sources'] = []
-        try:
-            notes_section = driver.find_element(By.CLASS_NAME, 'notes')
-            ol = notes_section.find_element(By.TAG_NAME, 'ol')
-            lis = ol.find_elements(By.TAG_NAME, 'li')
-            for i, li in enumerate(lis):
-                id_attr = li.get_attribute('id')
+        notes_section = select_first(tree, '.notes')
+        ol = next(notes_section.iter('ol'), None) if notes_section is not None else None
+        if ol is not None:
+            for i, li in enumerate(ol.iter('li')):
+                id_attr = li.get('id')
                 number = i + 1
-                inner_html = li.get_attribute('innerHTML')
-                markdown = html_to_markdown(inner_html, True)
+                markdown = element_to_markdown(li, True)
                 talk_data['sources'].append({'number': number, 'id': id_attr, 'markdown': markdown})
-        except:
-            pass
         # Extract year and month from URL if not provided
         if not year or not month:
-            match = re.search(r'/general-conference/(\d{4})/(\d{2})/', url)
+            match = CONFERENCE_URL_RE.search(url)
             if match:
                 year = match.group(1)
                 month_code = match.group(2)
@@ -430,124 +641,159 @@ def scrape_talk(url, session_name, year=None, month=None):
                 print(f"Error: No footnotes found for talk \"{talk_data['title']}\" at {url}")
         return talk_data
     except Exception as e:
+        if is_transient_error(e):
+            raise  # Let scrape_talk_with_retry back off and try again
         print(f"Error during scraping talk {url}: {e}")
         return None
-    finally:
-        driver.quit()
 
-def scrape_talk_with_retry(url, session_name, year=None, month=None, max_retries=3):
+def is_transient_error(e):
+    """Dropped connections, timeouts and server errors are worth retrying; 404s and malformed pages are not"""
+    if isinstance(e, requests.HTTPError):
+        return e.response is not None and e.response.status_code in TRANSIENT_STATUS_CODES
+    return isinstance(e, (requests.ConnectionError, requests.Timeout, WebDriverException))
+
+def scrape_talk_with_retry(url, session_name, year=None, month=None, max_retries=MAX_RETRIES):
     for attempt in range(max_retries):
-        talk = scrape_talk(url, session_name, year, month)
-        if talk:
-            return talk
-        print(f"Attempt {attempt + 1} failed for {url}. Retrying...")
-        time.sleep(5 * (attempt + 1))  # Exponential backoff
+        try:
+            # None means a permanent failure (already reported by scrape_talk), so don't retry it
+            return scrape_talk(url, session_name, year, month)
+        except Exception as e:
+            if attempt == max_retries - 1:
+                print(f"Error during scraping talk {url}: {e}")
+                break
+            # Full-jitter exponential backoff so parallel workers don't retry in lockstep
+            delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+            print(f"Attempt {attempt + 1} failed for {url} ({e}). Retrying in {delay:.1f}s...")
+            time.sleep(delay)
     print(f"Failed to scrape {url} after {max_retries} attempts")
     return None
 
 def get_conference_filename(year, month):
     """Generate the filename for a conference JSON file in the conference_json directory."""
-    sanitized_conference = re.sub(r'[^a-z0-9\- ]', '', f"{year}-{month.lower()}", flags=re.IGNORECASE)
+    sanitized_conference = FILENAME_UNSAFE_RE.sub('', f"{year}-{month.lower()}")
     return os.path.join(JSON_DIR, f"{sanitized_conference}.json")
 
-def scrape_conference(year, month):
-    month_code = '04' if month.lower() in ['apr', 'april'] else '10' if month.lower() in ['oct', 'october'] else None
-    if not month_code:
-        raise ValueError('Invalid month: Must be Apr/April or Oct/October')
-    conference_url = f"https://www.churchofjesuschrist.org/study/general-conference/{year}/{month_code}?lang=eng"
-    conference = f"{year}-{month.capitalize()}"
+def fill_sessions(conference_data, results):
+    """Copy of conference_data with the scraped talks added in conference order (independent of completion order)"""
+    sessions = {session_name: [] for session_name in conference_data['sessions']}
+    for talk in results:
+        if talk:
+            sessions[talk['session']].append(talk)
+    return {**conference_data, 'sessions': sessions}
+
+def load_conference_index(conference_url):
+    """Return the conference's session names and talk entries, from the disk cache or one Chrome load of the index page"""
+    cache_key = f"index:{conference_url}"
+    index = get_cached_page(cache_key)
+    if index is not None:
+        return index
+    index = {'sessions': [], 'talks': []}
     driver = create_driver()
-    conference_data = {'conference': conference, 'year': year, 'month': month.capitalize(), 'sessions': {}}
-    talk_list = []
     try:
         driver.get(conference_url)
-        WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
-        time.sleep(3)
+        WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.CSS_SELECTOR, 'ul.doc-map > li')))
         # Scroll to load all
         try:
-            for _ in range(5):
-                driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-                time.sleep(1)
+            scroll_until_loaded(driver)
         except Exception as e:
             print(f"Error scrolling conference page: {e}")
-        # Find all talks
-        li_elements = driver.find_elements(By.CSS_SELECTOR, 'ul.doc-map > li')
-        current_session_name = None
-        for li in li_elements:
-            a = li.find_element(By.TAG_NAME, 'a')
-            href = a.get_attribute('href')
-            full_url = href if href.startswith('https') else f"https://www.churchofjesuschrist.org{href}"
-            last_segment = full_url.split('/')[-1].split('?')[0]
-            if re.match(r'^\d{2}[a-z]+$', last_segment, re.IGNORECASE):
-                if current_session_name:
-                    title = ''
-                    try:
-                        title = li.find_element(By.CSS_SELECTOR, 'p.title').text
-                    except:
-                        pass
-                    speaker = ''
-                    try:
-                        speaker = li.find_element(By.CSS_SELECTOR, 'p.author').text
-                        speaker = normalize_speaker(speaker)
-                    except:
-                        pass
-                    talk_list.append({'url': full_url, 'session': current_session_name, 'title': title, 'speaker': speaker})
-            else:
-                try:
-                    title_p = li.find_element(By.CSS_SELECTOR, 'p.title')
-                    current_session_name = title_p.text
-                except:
-                    current_session_name = 'Unknown Session'
-                conference_data['sessions'][current_session_name] = []
+        li_elements = get_index_items(driver)
+    finally:
+        driver.quit()
+    # Talks listed before the first session header keep a session of None
+    current_session_name = None
+    for li in li_elements:
+        a = select_first(li, 'a')
+        if a is None or not a.get('href'):
+            continue
+        href = a.get('href')
+        full_url = href if href.startswith('https') else f"{BASE_URL}{href}"
+        last_segment = get_last_segment(full_url)
+        if is_talk_segment(last_segment):
+            speaker = first_text(li, 'p.author', '')
+            if speaker:
+                speaker = normalize_speaker(speaker)
+            index['talks'].append({'url': full_url, 'segment': last_segment, 'session': current_session_name, 'title': first_text(li, 'p.title', ''), 'speaker': speaker})
+        else:
+            current_session_name = first_text(li, 'p.title', 'Unknown Session')
+            index['sessions'].append(current_session_name)
+    store_cached_page(cache_key, index)
+    return index
+
+def scrape_conference(year, month):
+    month_code = '04' if month.lower() in ['apr', 'april'] else '10' if month.lower() in ['oct', 'october'] else None
+    if not month_code:
+        raise ValueError('Invalid month: Must be Apr/April or Oct/October')
+    conference_url = f"{BASE_URL}/study/general-conference/{year}/{month_code}?lang=eng"
+    conference = f"{year}-{month.capitalize()}"
+    conference_data = {'conference': conference, 'year': year, 'month': month.capitalize(), 'sessions': {}}
+    try:
+        index = load_conference_index(conference_url)
+        for session_name in index['sessions']:
+            conference_data['sessions'][session_name] = []
+        talk_list = [item for item in index['talks'] if item['session']]
         
-        # Scrape talks with SIMPLE parallel processing + REAL-TIME PROGRESS
+        # Scrape talks in parallel with real-time progress
         total_talks = len(talk_list)
         if total_talks > 0:
-            print(f'Scraping {total_talks} talks in parallel (5 workers)...')
+            print(f'Scraping {total_talks} talks in parallel ({SCRAPE_WORKERS} workers)...')
         
-        with tqdm(total=total_talks, desc="Scraping talks", unit="talk") as pbar:
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                # Submit all tasks
-                futures = []
-                for i, item in enumerate(talk_list):
-                    future = executor.submit(scrape_talk_with_retry, item['url'], item['session'], year, month)
-                    futures.append((i, future, item))
-                
+        filename = get_conference_filename(year, month)
+        # Checkpoints go to a side file so an interrupted re-scrape never replaces a complete conference file
+        partial_file = filename + '.partial'
+        results = [None] * total_talks
+        if use_cache and os.path.exists(partial_file):
+            # Resume: talks already saved by an interrupted run aren't fetched again (--no-cache starts over).
+            # Only talks still listed under the same session count, so a renamed session can't break fill_sessions
+            done = {talk['url']: talk for talks in load_json(partial_file)['sessions'].values() for talk in talks}
+            results = [done.get(item['url']) for item in talk_list]
+            results = [talk if talk and talk.get('session') == item['session'] else None for talk, item in zip(results, talk_list)]
+            resumed = sum(1 for talk in results if talk)
+            if resumed:
+                print(f'Resuming from {partial_file}: {resumed} talks already scraped')
+        completed = sum(1 for talk in results if talk)
+        with tqdm(total=total_talks, initial=completed, desc="Scraping talks", unit="talk") as pbar:
+            executor = ThreadPoolExecutor(max_workers=SCRAPE_WORKERS)
+            try:
+                futures = {executor.submit(scrape_talk_with_retry, item['url'], item['session'], year, month): i for i, item in enumerate(talk_list) if not results[i]}
                 # Process completed tasks as they finish
-                completed = 0
-                while completed < total_talks:
-                    for i, future, item in futures:
-                        if future.done():
-                            try:
-                                talk = future.result()
-                                if talk:
-                                    conference_data['sessions'][talk['session']].append(talk)
-                                else:
-                                    print(f"Failed: {item['title'] or 'Unknown'} ({item['url']})")
-                                pbar.update(1)
-                                completed += 1
-                            except Exception as e:
-                                print(f"Future error for {item['url']}: {e}")
-                                pbar.update(1)
-                                completed += 1
-                            futures[i] = (i, None, None)  # Mark as processed
-                            break
-                    time.sleep(0.1)  # Prevent busy waiting
+                for future in as_completed(futures):
+                    i = futures[future]
+                    item = talk_list[i]
+                    try:
+                        results[i] = future.result()
+                        if not results[i]:
+                            print(f"Failed: {item['title'] or 'Unknown'} ({item['url']})")
+                    except Exception as e:
+                        print(f"Future error for {item['url']}: {e}")
+                    pbar.update(1)
+                    completed += 1
+                    # Checkpoint so a crash or Ctrl-C partway through keeps the talks scraped so far
+                    if completed % CHECKPOINT_EVERY == 0 and completed < total_talks:
+                        save_json(fill_sessions(conference_data, results), partial_file)
+            except KeyboardInterrupt:
+                # Save what finished and drop the queued talks instead of waiting for all of them
+                save_json(fill_sessions(conference_data, results), partial_file)
+                executor.shutdown(wait=False, cancel_futures=True)
+                print(f"\nInterrupted; progress saved to {partial_file}")
+                raise
+            executor.shutdown()
         
-        # Save conference data
-        filename = get_conference_filename(year, month)
-        with open(filename, 'w') as f:
-            json.dump(conference_data, f, indent=2)
+        conference_data = fill_sessions(conference_data, results)
+        
+        # Save conference data, then drop the checkpoint it supersedes
+        save_json(conference_data, filename)
+        if os.path.exists(partial_file):
+            os.remove(partial_file)
         print(f"\n✅ Saved conference data to {filename}")
         # Save Gospel Library URLs to resources file
         save_conference_resources(conference_data, year, month)
+        flush_conference_resources()
     except Exception as e:
         print(f"Error scraping conference: {e}")
-    finally:
-        driver.quit()
 
 def scrape_single_talk(url):
-    match = re.search(r'/general-conference/(\d{4})/(\d{2})/', url)
+    match = CONFERENCE_URL_RE.search(url)
     year = match.group(1) if match else None
     month_code = match.group(2) if match else None
     month = 'April' if month_code == '04' else 'October' if month_code == '10' else None
@@ -556,42 +802,14 @@ def scrape_single_talk(url):
         return
     conference = f"{year}-{month.capitalize()}"
     filename = get_conference_filename(year, month)
-    conference_url = f"https://www.churchofjesuschrist.org/study/general-conference/{year}/{month_code}?lang=eng"
-    driver = create_driver()
+    conference_url = f"{BASE_URL}/study/general-conference/{year}/{month_code}?lang=eng"
     try:
-        driver.get(conference_url)
-        WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
-        time.sleep(3)
-        # Scroll to load all
-        try:
-            for _ in range(5):
-                driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-                time.sleep(1)
-        except Exception as e:
-            print(f"Error scrolling conference page: {e}")
-        # Find session
-        li_elements = driver.find_elements(By.CSS_SELECTOR, 'ul.doc-map > li')
-        current_session = 'Unknown Session'
-        session_name = 'Unknown Session'
-        talk_last_segment = url.split('/')[-1].split('?')[0]
-        found = False
-        for li in li_elements:
-            a = li.find_element(By.TAG_NAME, 'a')
-            href = a.get_attribute('href')
-            full_url = href if href.startswith('https') else f"https://www.churchofjesuschrist.org{href}"
-            last_seg = full_url.split('/')[-1].split('?')[0]
-            if re.match(r'^\d{2}[a-z]+$', last_seg, re.IGNORECASE):
-                if last_seg == talk_last_segment:
-                    session_name = current_session
-                    found = True
-                    break
-            else:
-                try:
-                    title_p = li.find_element(By.CSS_SELECTOR, 'p.title')
-                    current_session = title_p.text
-                except:
-                    current_session = 'Unknown Session'
-        if not found:
+        # Find session (the index is cached, so re-running single talks skips Chrome)
+        index = load_conference_index(conference_url)
+        talk_last_segment = get_last_segment(url)
+        session_name = next((item['session'] or 'Unknown Session' for item in index['talks'] if item['segment'] == talk_last_segment), None)
+        if session_name is None:
+            session_name = 'Unknown Session'
             print(f"Warning: Could not find session for talk at {url}. Using 'Unknown Session'.")
         # Scrape talk with retry
         talk = scrape_talk_with_retry(url, session_name, year, month)
@@ -600,34 +818,46 @@ def scrape_single_talk(url):
             return
         # Load or create conference_data
         if os.path.exists(filename):
-            with open(filename, 'r') as f:
-                conference_data = json.load(f)
+            conference_data = load_json(filename)
         else:
             conference_data = {'conference': conference, 'year': year, 'month': month.capitalize(), 'sessions': {}}
         # Add or update talk (no duplicates by title)
-        if session_name not in conference_data['sessions']:
-            conference_data['sessions'][session_name] = []
-        existing_talk = next((t for t in conference_data['sessions'][session_name] if t['title'] == talk['title']), None)
-        if existing_talk:
-            existing_talk.update(talk)
+        session_talks = conference_data['sessions'].setdefault(session_name, [])
+        title_index = {}
+        for i, t in enumerate(session_talks):
+            title_index.setdefault(t['title'], i)  # First talk wins, as before
+        existing_index = title_index.get(talk['title'])
+        if existing_index is not None:
+            session_talks[existing_index].update(talk)
             print(f"Updated talk '{talk['title']}' in {filename}")
         else:
-            conference_data['sessions'][session_name].append(talk)
+            session_talks.append(talk)
             print(f"Added talk '{talk['title']}' to {filename}")
         # Save conference data
-        with open(filename, 'w') as f:
-            json.dump(conference_data, f, indent=2)
+        save_json(conference_data, filename)
         print(f"Saved updated data to {filename}")
         # Save Gospel Library URL to resources file
         save_conference_resources(conference_data, year, month)
     except Exception as e:
         print(f"Error in scrape_single_talk: {e}")
-    finally:
-        driver.quit()
 
 if __name__ == '__main__':
     args = sys.argv[1:]
-    if len(args) == 2:
+    if '--no-cache' in args:
+        args.remove('--no-cache')
+        use_cache = False
+    if args == ['--serve']:
+        for line in sys.stdin:
+            url = line.strip()
+            if not url:
+                continue
+            if url.startswith('https://'):
+                scrape_single_talk(url)
+                # Save the resource URLs as each talk lands, like its conference file; a killed run would otherwise lose them all
+                flush_conference_resources()
+            else:
+                print(f'Invalid URL: {url}')
+    elif len(args) == 2:
         year, month = args
         scrape_conference(year, month)
     elif len(args) == 1:
@@ -637,5 +867,5 @@ if __name__ == '__main__':
         else:
             print('Invalid URL')
     else:
-        print('Usage: python website_scraper.py <year> <month> or python website_scraper.py <talk_url>')
+        print('Usage: python website_scraper.py [--no-cache] <year> <month> or python website_scraper.py [--no-cache] <talk_url> or python website_scraper.py [--no-cache] --serve < talk_urls')
         sys.exit(1)
\ No newline at end of file
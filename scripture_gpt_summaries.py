@@ -16,6 +16,12 @@
 # 4. Update with debug logging enabled:
 #    python3 scripture_gpt_summaries.py --update "Matthew 5" --debug
 #
+# 5. Re-summarize every chapter of a book or volume, including ones whose verses haven't changed:
+#    python3 scripture_gpt_summaries.py --update Matthew --force
+#
+# 6. Regenerate even if the chapter's summaries are already cached in .summary_cache:
+#    python3 scripture_gpt_summaries.py --update "Matthew 5" --no-cache
+#
 # Note: For books with aliases like "D&C", it will automatically map to "Doctrine and Covenants".
 # Ensure the JSON files (e.g., new_testament.json) contain the structured data with books, chapters, and verses.
 
@@ -23,15 +29,29 @@ import os
 import re
 import json
 import time
+import random
+import shelve
+import atexit
+import hashlib
+import threading
+import grpc
 from dotenv import load_dotenv
 import argparse
+from collections import Counter
+import mmap
+from functools import lru_cache
 from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from xai_sdk import Client
-from xai_sdk.chat import user
+from xai_sdk.chat import system, user
 from xai_sdk.search import SearchParameters, web_source
 from urllib.parse import urlparse
 
+try:
+    import orjson  # optional: parses the multi-MB volume files several times faster than json
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -39,6 +59,34 @@ load_dotenv()
 api_key = os.getenv('XAI_API_KEY')
 client = Client(api_key=api_key)
 
+# On-disk cache of generated summaries, keyed by everything that goes into the request (skip with --no-cache)
+CACHE_FILE = '.summary_cache'
+PROMPT_VERSION = 3  # bump when the prompt or model settings change so old answers aren't reused
+_cache = shelve.open(CACHE_FILE)
+_cache_lock = threading.Lock()
+atexit.register(_cache.close)
+use_cache = True
+
+# Chapters summarized concurrently (override with SUMMARY_WORKERS in .env). Each call is a blocking
+# network wait, so threads scale fine here without moving to asyncio
+SUMMARY_WORKERS = int(os.getenv('SUMMARY_WORKERS', '10'))
+
+# Retry settings for summary requests (jittered exponential backoff)
+MAX_RETRIES = 5
+BACKOFF_BASE = 2.0
+BACKOFF_CAP = 60.0
+# gRPC statuses that will fail the same way every time (bad request, bad key, unknown model), so don't retry them
+PERMANENT_GRPC_CODES = {
+    grpc.StatusCode.INVALID_ARGUMENT,
+    grpc.StatusCode.UNAUTHENTICATED,
+    grpc.StatusCode.PERMISSION_DENIED,
+    grpc.StatusCode.NOT_FOUND,
+    grpc.StatusCode.UNIMPLEMENTED,
+}
+
+# Save the volume file every this many finished chapters during book/volume updates
+CHECKPOINT_EVERY = 25
+
 # List of volume files
 volumes = [
     "old_testament.json",
@@ -53,6 +101,8 @@ book_aliases = {
     "D&C": "Doctrine and Covenants"
 }
 
+# Memoized: the same resource URLs come up chapter after chapter
+@lru_cache(maxsize=8192)
 def get_domain(url):
     parsed = urlparse(url)
     domain = parsed.netloc
@@ -60,71 +110,105 @@ def get_domain(url):
         domain = domain[4:]
     return domain
 
-def parse_related_scriptures(s):
-    import re
-    s = s.strip("[] ")
-    parts = s.split(';')
-    result = []
-    for part in parts:
-        part = part.strip()
-        if part:
-            splitted = re.split(r'\s*~\s*', part, maxsplit=1)
-            if len(splitted) == 2:
-                link = splitted[0].strip()
-                desc = splitted[1].strip()
-                result.append({"link": link, "description": desc})
-    return result
-
-# Function to generate AI summaries using xAI SDK
+# Distinct search domains for a chapter's resource URLs. Memoized: chapters in a book mostly list the same sites,
+# and the sorted tuple keeps the order (and so the request) stable from run to run
+@lru_cache(maxsize=1024)
+def get_allowed_websites(urls):
+    return tuple(sorted({get_domain(url) for url in urls}))
+
+# Search settings per distinct set of allowed sites, shared by every chapter and retry that uses them
+@lru_cache(maxsize=256)
+def get_search_parameters(allowed_websites):
+    return SearchParameters(
+        mode="auto",
+        max_search_results=5,
+        sources=[web_source(allowed_websites=list(allowed_websites))]
+    )
+
+# Instructions shared by every chapter. Sent as an identical leading system message so the
+# provider can reuse its cached prefix instead of re-ingesting ~1 kB of boilerplate per chapter
+SUMMARY_INSTRUCTIONS = (
+    "For the scripture chapter named in the request, provide:\n"
+    "1. Child Summary: A simple summary (1-2 sentences, max 50 words) as if explaining to a young child.\n"
+    "2. Normal Summary: A detailed summary (2-3 sentences, max 100 words) capturing the main events, teachings, and themes. Could include references wiki-link references to verses from the same chapter (e.g., [[<Book> <Chapter>#1|v1-10]] — description of event or theme) \n"
+    "3. Context Summary: A brief summary (1 sentence) including speaker, location, audience, and context.\n"
+    "4. Tags: Provide 1-3 doctrinal tags related to The Church of Jesus Christ of Latter-day Saints, starting with #Gospel/ (e.g., #Gospel/Atonement #Gospel/Faith #Gospel/EndureToTheEnd), separated by spaces.\n"
+    "5. Related Scriptures: Search the internet for 1-3 related scriptures (chapters or specific verses) from other religious texts with similar themes, teachings, or events. For each, provide a wiki-style link and a brief (max 25 words). Compare and contrast the reason for its relevance. Prioritize referencing to an entire chapter or shorter verse ranges and avoid ranges of greater than 5 verses.\n"
+    "Notes:\n"
+    "- Do not start summaries with redundant references to the Book / Chapter name (e.g., 'In <Book> <Chapter>' or 'In this chapter').\n"
+    "- Use wiki-style links in Obsidian format (e.g., [[John 1]] or [[1 Nephi 1#5|1 Nephi 1:5-8]][[1 Nephi 1#6|]][[1 Nephi 1#7|]][[1 Nephi 1#8|]]) for specific verses or ranges, displaying the range in the first link and linking subsequent verses without display text.\n"
+    "- When linking an entire chapter, do not use verse reference style. Include only a link to the file (e.g., [[Alma 5]]).\n"
+    "- When linking a verse range, reference the first verse and include the range in the description, then reference each verse in the range as a link with an empty string as the description(e.g., [[Genesis 5#2|Genesis 5:2-4]][[Genesis 5#3|]][[Genesis 5#4|]]).\n"
+    "- For Doctrine and Covenants, use [[D&C 1#5]] instead of spelling out 'Doctrine and Covenants'.\n"
+    "- Only include the chapter reference (e.g., '[[<Book> <Chapter>]]') in the output, not the full chapter text.\n\n"
+    "Output Format:\n"
+    "Return only a JSON object with these keys:\n"
+    '{"child_summary": "child summary here", "normal_summary": "normal summary here", "context_summary": "context summary here", '
+    '"tags": "#Gospel/Tag1 #Gospel/Tag2", "related_scriptures": [{"link": "wikilink1", "description": "brief reason"}, ...]}\n'
+)
+
+# Per-chapter user turn
+CHAPTER_PROMPT = "Provide the following for '{book} {chapter}' from the scriptures.\nChapter Reference: {book} {chapter}\n"
+
+def summary_cache_key(book, chapter, verses, allowed_websites):
+    payload = json.dumps({
+        "version": PROMPT_VERSION,
+        "book": book,
+        "chapter": str(chapter),
+        "verses": verses,
+        "allowed_websites": sorted(allowed_websites),
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def retry_delay(e, attempt):
+    """Full-jitter backoff so parallel workers don't retry in lockstep, stretched to any retry-after the server sent"""
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+    if isinstance(e, grpc.Call):
+        for key, value in e.trailing_metadata() or ():
+            if key.lower() == 'retry-after':
+                try:
+                    delay = max(delay, float(value))
+                except ValueError:
+                    pass
+    return delay
+
+# Function to generate AI summaries using xAI SDK (answers are cached, re-runs over unchanged chapters make no API calls)
 def generate_ai_summaries(book, chapter, verses, allowed_websites=None, debug=False):
     if allowed_websites is None:
         allowed_websites = []
     if not allowed_websites:
         allowed_websites = ["churchofjesuschrist.org", "scriptures.byu.edu"]
     
-    # Concatenate verses into a single text block
-    chapter_text = "\n".join([f"Verse {verse}: {text}" for verse, text in sorted(verses.items(), key=lambda x: int(x[0]))])
+    cache_key = summary_cache_key(book, chapter, verses, allowed_websites)
+    if use_cache:
+        with _cache_lock:
+            cached = _cache.get(cache_key)
+        if cached is not None and cached[0] and cached[1]:
+            if debug:
+                print(f"Debug: Using cached summaries for {book} {chapter}\n")
+            return cached[:5] + (0, 0, 0, 0)  # No tokens or searches spent on a cache hit
     
-    # Prompt for three summaries
-    prompt = (
-        f"Provide the following for '{book} {chapter}' from the scriptures:\n"
-        f"1. Child Summary: A simple summary (1-2 sentences, max 50 words) as if explaining to a young child.\n"
-        f"2. Normal Summary: A detailed summary (2-3 sentences, max 100 words) capturing the main events, teachings, and themes. Could include references wiki-link references to verses from the same chapter (e.g., [[{book} {chapter}#1|v1-10]] — description of event or theme) \n"
-        f"3. Context Summary: A brief summary (1 sentence) including speaker, location, audience, and context.\n"
-        f"4. Tags: Provide 1-3 doctrinal tags related to The Church of Jesus Christ of Latter-day Saints, starting with #Gospel/ (e.g., #Gospel/Atonement #Gospel/Faith #Gospel/EndureToTheEnd), separated by spaces.\n"
-        f"5. Related Scriptures: Search the internet for 1-3 related scriptures (chapters or specific verses) from other religious texts with similar themes, teachings, or events. For each, provide a wiki-style link and a brief (max 25 words). Compare and contrast the reason for its relevance. Prioritize referencing to an entire chapter or shorter verse ranges and avoid ranges of greater than 5 verses.\n"
-        f"Notes:\n"
-        f"- Do not start summaries with redundant references to the Book / Chapter name (e.g., 'In {book} {chapter}' or 'In this chapter').\n"
-        f"- Use wiki-style links in Obsidian format (e.g., [[John 1]] or [[1 Nephi 1#5|1 Nephi 1:5-8]][[1 Nephi 1#6|]][[1 Nephi 1#7|]][[1 Nephi 1#8|]]) for specific verses or ranges, displaying the range in the first link and linking subsequent verses without display text.\n"
-        f"- When linking an entire chapter, do not use verse reference style. Include only a link to the file (e.g., [[Alma 5]])./n"
-        f"- When linking a verse range, reference the first verse and include the range in the description, then reference each verse in the range as a link with an empty string as the description(e.g., [[Genesis 5#2|Genesis 5:2-4]][[Genesis 5#3|]][[Genesis 5#4|]])./n"
-        f"- For Doctrine and Covenants, use [[D&C 1#5]] instead of spelling out 'Doctrine and Covenants'.\n"
-        f"- Only include the chapter reference (e.g., '[[{book} {chapter}]]') in the output, not the full chapter text.\n"
-        f"Chapter Reference: {book} {chapter}\n\n"
-        f"Output Format:\n"
-        f"Child Summary: [child summary here]\n"
-        f"Normal Summary: [normal summary here]\n"
-        f"Context Summary: [context summary here]\n"
-        f"Tags: [tags here]\n"
-        f"Related Scriptures: [wikilink1 ~ Brief reason; wikilink2 ~ Brief reason; ...]\n"
-    )
+    # Only the chapter reference changes per call; the instructions go first as a fixed system message.
+    # The verse text itself is not sent (the model is asked for the reference only), so it isn't joined here
+    prompt = CHAPTER_PROMPT.format(book=book, chapter=chapter)
     
     if debug:
-        print(f"Debug: Prompt for {book} {chapter}:\n{prompt}\n")
+        print(f"Debug: Prompt for {book} {chapter}:\n{SUMMARY_INSTRUCTIONS}\n{prompt}\n")
+    
+    # Same search settings on every attempt (and for every chapter with the same sites), so build them once
+    search_parameters = get_search_parameters(tuple(allowed_websites))
     
-    max_retries = 5
+    max_retries = MAX_RETRIES
     for attempt in range(max_retries):
         try:
             chat = client.chat.create(
                 model="grok-4",
                 temperature=0.7,
                 max_tokens=4096,
-                search_parameters=SearchParameters(
-                    mode="auto",
-                    max_search_results=5,
-                    sources=[web_source(allowed_websites=allowed_websites)]
-                )
+                search_parameters=search_parameters,
+                response_format="json_object"
             )
+            chat.append(system(SUMMARY_INSTRUCTIONS))
             chat.append(user(prompt))
             response = chat.sample()
             
@@ -139,50 +223,21 @@ def generate_ai_summaries(book, chapter, verses, allowed_websites=None, debug=Fa
             if debug:
                 print(f"Debug: Raw output for {book} {chapter}:\n{output}\n")
             
-            # Better parsing to handle multi-line summaries
-            lines = output.split("\n")
-            current = None
-            child_summary_lines = []
-            normal_summary_lines = []
-            context_summary_lines = []
-            tags_lines = []
-            related_scriptures_lines = []
-            
-            for line in lines:
-                if line.startswith("Child Summary:"):
-                    current = child_summary_lines
-                    content = line.split(":", 1)[1].strip() if ":" in line else ""
-                    if content:
-                        current.append(content)
-                elif line.startswith("Normal Summary:"):
-                    current = normal_summary_lines
-                    content = line.split(":", 1)[1].strip() if ":" in line else ""
-                    if content:
-                        current.append(content)
-                elif line.startswith("Context Summary:"):
-                    current = context_summary_lines
-                    content = line.split(":", 1)[1].strip() if ":" in line else ""
-                    if content:
-                        current.append(content)
-                elif line.startswith("Tags:"):
-                    current = tags_lines
-                    content = line.split(":", 1)[1].strip() if ":" in line else ""
-                    if content:
-                        current.append(content)
-                elif line.startswith("Related Scriptures:"):
-                    current = related_scriptures_lines
-                    content = line.split(":", 1)[1].strip() if ":" in line else ""
-                    if content:
-                        current.append(content)
-                else:
-                    if current is not None and line.strip():
-                        current.append(line.strip())
-            
-            child_summary = " ".join(child_summary_lines)
-            normal_summary = " ".join(normal_summary_lines)
-            context_summary = " ".join(context_summary_lines)
-            tags_str = " ".join(tags_lines)
-            related_scriptures_str = " ".join(related_scriptures_lines)
+            # The reply is a JSON object (response_format="json_object"); anything malformed raises and is retried
+            reply = json.loads(output)
+            child_summary = reply.get("child_summary", "")
+            normal_summary = reply.get("normal_summary", "")
+            if not child_summary or not normal_summary:
+                # An empty object or missing summaries is a bad reply, not an answer: retry it, never cache it
+                raise ValueError("reply is missing child_summary or normal_summary")
+            context_summary = reply.get("context_summary", "")
+            tags = reply.get("tags", "")
+            tags_str = " ".join(tags) if isinstance(tags, list) else tags
+            related_scriptures = [
+                {"link": r["link"].strip(), "description": r["description"].strip()}
+                for r in reply.get("related_scriptures", [])
+                if isinstance(r, dict) and r.get("link") and r.get("description")
+            ]
             
             prompt_tokens = response.usage.prompt_tokens if hasattr(response.usage, 'prompt_tokens') else 0
             completion_tokens = response.usage.completion_tokens
@@ -195,19 +250,74 @@ def generate_ai_summaries(book, chapter, verses, allowed_websites=None, debug=Fa
                 print(f"Normal: {normal_summary}")
                 print(f"Context: {context_summary}")
                 print(f"Tags: {tags_str}")
-                print(f"Related Scriptures Str: {related_scriptures_str}\n")
+                print(f"Related Scriptures: {related_scriptures}\n")
                 print(f"Input Tokens: {prompt_tokens}")
                 print(f"Completion Tokens: {completion_tokens}")
                 print(f"Reasoning Tokens: {reasoning_tokens}")
                 print(f"Searches: {searches}\n")
             
-            return child_summary, normal_summary, context_summary, tags_str, related_scriptures_str, prompt_tokens, completion_tokens, reasoning_tokens, searches
+            result = (child_summary, normal_summary, context_summary, tags_str, related_scriptures, prompt_tokens, completion_tokens, reasoning_tokens, searches)
+            if use_cache:
+                with _cache_lock:
+                    _cache[cache_key] = result
+                    _cache.sync()
+            return result
         except Exception as e:
-            wait_time = 2 ** attempt
-            print(f"Error generating summary for {book} {chapter}: {e}. Retrying in {wait_time} seconds... (Attempt {attempt + 1}/{max_retries})")
+            if isinstance(e, grpc.RpcError) and e.code() in PERMANENT_GRPC_CODES:
+                print(f"Error generating summary for {book} {chapter}: {e}. Not retrying.")
+                return "", "", "", "", [], 0, 0, 0, 0
+            if attempt == max_retries - 1:
+                print(f"Error generating summary for {book} {chapter}: {e}.")
+                break
+            wait_time = retry_delay(e, attempt)
+            print(f"Error generating summary for {book} {chapter}: {e}. Retrying in {wait_time:.1f} seconds... (Attempt {attempt + 1}/{max_retries})")
             time.sleep(wait_time)
     print(f"Max retries exceeded for {book} {chapter}")
-    return "", "", "", "", "", 0, 0, 0, 0
+    return "", "", "", "", [], 0, 0, 0, 0
+
+def load_volume(file_path):
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def save_volume(data, file_path):
+    """Write to a temp file and swap it in so an interrupted save never leaves a truncated volume file.
+    Stays on json: orjson only indents by 2, and the volume files are kept at 4 to keep their diffs readable"""
+    tmp_file = file_path + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+    os.replace(tmp_file, file_path)
+
+def volume_may_contain_book(file_path, book_name):
+    """Cheap byte scan of the raw volume file for the book's "name" entry, so a book lookup only parses the volume
+    that has it. Answers True whenever it can't be sure (non-ASCII names may be stored \\u-escaped)"""
+    if not book_name.isascii():
+        return True
+    pattern = re.compile(rb'"name":\s*"' + re.escape(book_name.encode('ascii')) + rb'"', re.IGNORECASE)
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pattern.search(mm) is not None
+
+# Fingerprint of a chapter's verses, stored in ai_resources so unchanged chapters can be skipped
+def get_verses_hash(verses):
+    return hashlib.blake2b(json.dumps(verses, sort_keys=True, ensure_ascii=False).encode('utf-8'), digest_size=16).hexdigest()
+
+def apply_ai_summaries(chapter, result, verses_hash):
+    """Store a generated summary and its verses hash in the chapter. A failed generation (empty summaries) leaves
+    any existing ai_resources, good summary and hash included, untouched so it isn't lost. Returns True if stored"""
+    child, normal, context, tags, related_list = result[:5]
+    if not child or not normal:
+        return False
+    ai_resources = chapter.setdefault("ai_resources", {})
+    ai_resources["child_summary"] = child
+    ai_resources["summary"] = normal
+    ai_resources["context_summary"] = context
+    ai_resources["tags"] = tags
+    ai_resources["related_scriptures"] = related_list
+    ai_resources["verses_hash"] = verses_hash
+    return True
 
 # Helper to find book in list of books
 def find_book(books, book_name):
@@ -231,76 +341,65 @@ def update_chapter(data, volume_name, books, book_name, chapter_num, file_path,
         if chapter:
             print(f"Processing {book_name} {chapter_num}")
             resources = chapter.get("chapter_resources", [])
-            allowed_websites = list(set(get_domain(r["url"]) for r in resources if "url" in r))
+            allowed_websites = get_allowed_websites(tuple(r["url"] for r in resources if "url" in r))
             verses_list = chapter.get("verses", [])
             verses = {str(v["number"]): v["text"] for v in verses_list}
             if verses:
-                child, normal, context, tags, related_str, in_tokens, comp_tokens, reas_tokens, searches = generate_ai_summaries(book_name, chapter_num, verses, allowed_websites=allowed_websites, debug=debug)
-                related_list = parse_related_scriptures(related_str)
-                if "ai_resources" not in chapter:
-                    chapter["ai_resources"] = {}
-                chapter["ai_resources"]["child_summary"] = child
-                chapter["ai_resources"]["summary"] = normal
-                chapter["ai_resources"]["context_summary"] = context
-                chapter["ai_resources"]["tags"] = tags
-                chapter["ai_resources"]["related_scriptures"] = related_list
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
+                result = generate_ai_summaries(book_name, chapter_num, verses, allowed_websites=allowed_websites, debug=debug)
+                in_tokens, comp_tokens, reas_tokens, searches = result[5:]
+                if apply_ai_summaries(chapter, result, get_verses_hash(verses)):
+                    save_volume(data, file_path)
+                else:
+                    print(f"Summary generation failed for {book_name} {chapter_num}; existing summaries kept")
                 print(f"Sum for this operation - Input Tokens: {in_tokens}, Completion Tokens: {comp_tokens}, Reasoning Tokens: {reas_tokens}, Searches: {searches}")
                 return True
     return False
 
 # Function to update all chapters in a book
-def update_book(data, volume_name, books, book_name, file_path, debug=False):
+def update_book(data, volume_name, books, book_name, file_path, debug=False, force=False):
     book = find_book(books, book_name)
     if book:
         chapter_tasks = [(book_name, chapter) for chapter in book["chapters"]]
         total_chapters = len(chapter_tasks)
-        total_input = 0
-        total_completion = 0
-        total_reasoning = 0
-        total_searches = 0
+        totals = Counter()  # Token and search usage summed over the batch
+        completed = 0
 
         def process_chapter(task):
             bk_name, bk_chapter = task
             chapter_num = str(bk_chapter["number"])
             resources = bk_chapter.get("chapter_resources", [])
-            allowed_websites = list(set(get_domain(r["url"]) for r in resources if "url" in r))
+            allowed_websites = get_allowed_websites(tuple(r["url"] for r in resources if "url" in r))
             verses_list = bk_chapter.get("verses", [])
             verses = {str(v["number"]): v["text"] for v in verses_list}
             if verses:
-                return bk_chapter, generate_ai_summaries(bk_name, chapter_num, verses, allowed_websites=allowed_websites, debug=debug)
-            return bk_chapter, None
+                verses_hash = get_verses_hash(verses)
+                # Already summarized from these exact verses: nothing to do unless forced
+                if not force and bk_chapter.get("ai_resources", {}).get("verses_hash") == verses_hash:
+                    return bk_chapter, None, None
+                return bk_chapter, generate_ai_summaries(bk_name, chapter_num, verses, allowed_websites=allowed_websites, debug=debug), verses_hash
+            return bk_chapter, None, None
 
-        with ThreadPoolExecutor(max_workers=10) as executor:
+        with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as executor:
             futures = [executor.submit(process_chapter, task) for task in chapter_tasks]
             for future in tqdm(as_completed(futures), total=total_chapters, desc=f"Processing {book_name}", unit="chapter"):
-                chapter, result = future.result()
+                chapter, result, verses_hash = future.result()
                 if result:
-                    child, normal, context, tags, related_str, in_tokens, comp_tokens, reas_tokens, searches = result
-                    related_list = parse_related_scriptures(related_str)
-                    if "ai_resources" not in chapter:
-                        chapter["ai_resources"] = {}
-                    chapter["ai_resources"]["child_summary"] = child
-                    chapter["ai_resources"]["summary"] = normal
-                    chapter["ai_resources"]["context_summary"] = context
-                    chapter["ai_resources"]["tags"] = tags
-                    chapter["ai_resources"]["related_scriptures"] = related_list
-                    total_input += in_tokens
-                    total_completion += comp_tokens
-                    total_reasoning += reas_tokens
-                    total_searches += searches
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        print(f"Sum for the batch - Input Tokens: {total_input}, Completion Tokens: {total_completion}, Reasoning Tokens: {total_reasoning}, Searches: {total_searches}")
+                    in_tokens, comp_tokens, reas_tokens, searches = result[5:]
+                    apply_ai_summaries(chapter, result, verses_hash)
+                    totals.update(input=in_tokens, completion=comp_tokens, reasoning=reas_tokens, searches=searches)
+                completed += 1
+                # Checkpoint so a crash partway through a long book keeps the summaries generated so far
+                if completed % CHECKPOINT_EVERY == 0 and completed < total_chapters:
+                    save_volume(data, file_path)
+
+        save_volume(data, file_path)
+        print(f"Sum for the batch - Input Tokens: {totals['input']}, Completion Tokens: {totals['completion']}, Reasoning Tokens: {totals['reasoning']}, Searches: {totals['searches']}")
         return True
     return False
 
 # Function to update all books in a volume
-def update_volume(file_path, debug=False):
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+def update_volume(file_path, debug=False, force=False):
+    data = load_volume(file_path)
     volume_name = list(data.keys())[0]
     books = data[volume_name]
     chapter_tasks = []
@@ -309,60 +408,59 @@ def update_volume(file_path, debug=False):
         for chapter in book["chapters"]:
             chapter_tasks.append((book_name, chapter))
     total_chapters = len(chapter_tasks)
-    total_input = 0
-    total_completion = 0
-    total_reasoning = 0
-    total_searches = 0
+    totals = Counter()  # Token and search usage summed over the batch
+    completed = 0
 
     def process_chapter(task):
         bk_name, bk_chapter = task
         chapter_num = str(bk_chapter["number"])
         resources = bk_chapter.get("chapter_resources", [])
-        allowed_websites = list(set(get_domain(r["url"]) for r in resources if "url" in r))
+        allowed_websites = get_allowed_websites(tuple(r["url"] for r in resources if "url" in r))
         verses_list = bk_chapter.get("verses", [])
         verses = {str(v["number"]): v["text"] for v in verses_list}
         if verses:
-            return bk_chapter, generate_ai_summaries(bk_name, chapter_num, verses, allowed_websites=allowed_websites, debug=debug)
-        return bk_chapter, None
+            verses_hash = get_verses_hash(verses)
+            # Already summarized from these exact verses: nothing to do unless forced
+            if not force and bk_chapter.get("ai_resources", {}).get("verses_hash") == verses_hash:
+                return bk_chapter, None, None
+            return bk_chapter, generate_ai_summaries(bk_name, chapter_num, verses, allowed_websites=allowed_websites, debug=debug), verses_hash
+        return bk_chapter, None, None
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
+    with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as executor:
         futures = [executor.submit(process_chapter, task) for task in chapter_tasks]
         for future in tqdm(as_completed(futures), total=total_chapters, desc=f"Processing {volume_name}", unit="chapter"):
-            chapter, result = future.result()
+            chapter, result, verses_hash = future.result()
             if result:
-                child, normal, context, tags, related_str, in_tokens, comp_tokens, reas_tokens, searches = result
-                related_list = parse_related_scriptures(related_str)
-                if "ai_resources" not in chapter:
-                    chapter["ai_resources"] = {}
-                chapter["ai_resources"]["child_summary"] = child
-                chapter["ai_resources"]["summary"] = normal
-                chapter["ai_resources"]["context_summary"] = context
-                chapter["ai_resources"]["tags"] = tags
-                chapter["ai_resources"]["related_scriptures"] = related_list
-                total_input += in_tokens
-                total_completion += comp_tokens
-                total_reasoning += reas_tokens
-                total_searches += searches
-
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=4)
-    print(f"Sum for the batch - Input Tokens: {total_input}, Completion Tokens: {total_completion}, Reasoning Tokens: {total_reasoning}, Searches: {total_searches}")
+                in_tokens, comp_tokens, reas_tokens, searches = result[5:]
+                apply_ai_summaries(chapter, result, verses_hash)
+                totals.update(input=in_tokens, completion=comp_tokens, reasoning=reas_tokens, searches=searches)
+            completed += 1
+            # Checkpoint so a crash partway through a volume keeps the summaries generated so far
+            if completed % CHECKPOINT_EVERY == 0 and completed < total_chapters:
+                save_volume(data, file_path)
+
+    save_volume(data, file_path)
+    print(f"Sum for the batch - Input Tokens: {totals['input']}, Completion Tokens: {totals['completion']}, Reasoning Tokens: {totals['reasoning']}, Searches: {totals['searches']}")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Update AI summaries in JSON scripture files.")
     parser.add_argument("--update", required=True, help="Volume file (e.g., new_testament.json), book (e.g., Matthew), or book chapter (e.g., Matthew 5)")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument("--force", action="store_true", help="Re-summarize book/volume chapters even if their verses are unchanged since the last run")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore .summary_cache and call the API for every chapter")
     args = parser.parse_args()
+    use_cache = not args.no_cache
 
     target = args.update.strip()
     processed = False
     debug = args.debug
+    force = args.force
 
     if target.endswith(".json"):
         # Update entire volume
         file_path = os.path.join("lds_scriptures_json", target)
         if os.path.exists(file_path):
-            update_volume(file_path, debug=debug)
+            update_volume(file_path, debug=debug, force=force)
             processed = True
         else:
             print(f"Volume file {target} not found.")
@@ -380,10 +478,9 @@ if __name__ == "__main__":
 
         for vol_file in volumes:
             file_path = os.path.join("lds_scriptures_json", vol_file)
-            if not os.path.exists(file_path):
+            if not os.path.exists(file_path) or not volume_may_contain_book(file_path, book_name):
                 continue
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_volume(file_path)
             volume_name = list(data.keys())[0]
             books = data[volume_name]
 
@@ -394,7 +491,7 @@ if __name__ == "__main__":
                     break
             else:
                 # Update entire book
-                if update_book(data, volume_name, books, book_name, file_path, debug=debug):
+                if update_book(data, volume_name, books, book_name, file_path, debug=debug, force=force):
                     processed = True
                     break
 
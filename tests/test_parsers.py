@@ -0,0 +1,292 @@
+"""
+Old-vs-new checks for the pure parsing helpers the performance work rewrote.
+
+The expected values were recorded by running the implementations they replaced (the regex html_to_markdown over the
+browser's innerHTML, the hand-rolled query parse in get_wikilink, the chained role re.subs, the labelled-text summary
+reply), so a failure here means a rewrite changed what gets saved. The few deliberate differences are called out.
+
+Run from the repo root with: python -m pytest -q
+"""
+
+import os
+import json
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+LOADED = []
+
+
+def load_script(name, filename):
+    spec = importlib.util.spec_from_file_location(name, ROOT / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    LOADED.append(module)
+    return module
+
+
+@pytest.fixture(scope="session", autouse=True)
+def workdir(tmp_path_factory):
+    # The scripts open their shelve caches relative to the working directory at import time
+    path = tmp_path_factory.mktemp("work")
+    previous = os.getcwd()
+    os.chdir(path)
+    yield path
+    # Close the caches here rather than at exit, which would write them relative to the restored directory
+    for module in LOADED:
+        module._cache.close()
+    os.chdir(previous)
+
+
+@pytest.fixture(scope="session")
+def scraper(workdir):
+    pytest.importorskip("lxml.html")
+    pytest.importorskip("selenium")
+    return load_script("scrape_conference", "scrape-conference.py")
+
+
+@pytest.fixture(scope="session")
+def newsroom(workdir):
+    pytest.importorskip("xai_sdk")
+    return load_script("add_conference_resource_newsroom", "add_conference_resource_newsroom.py")
+
+
+@pytest.fixture(scope="session")
+def summaries(workdir):
+    pytest.importorskip("xai_sdk")
+    os.environ.setdefault("XAI_API_KEY", "test")
+    return load_script("scripture_gpt_summaries", "scripture_gpt_summaries.py")
+
+
+# --- scrape-conference.py: parse_scripture_link / get_wikilink ---
+
+SCRIPTURES = "https://www.churchofjesuschrist.org/study/scriptures/"
+
+WIKILINK_CASES = [
+    ("bofm/alma/32?lang=eng&id=p21-p23#p21", "[[Alma 32#21|TEXT]][[Alma 32#22|]][[Alma 32#23|]]"),
+    ("dc-testament/dc/58?lang=eng&id=p26-p28#p26", "[[D&C 58#26|TEXT]][[D&C 58#27|]][[D&C 58#28|]]"),
+    ("bofm/mosiah/2#p17", "[[Mosiah 2#17|TEXT]]"),
+    ("nt/john/1?id=p9", "[[John 1#9|TEXT]]"),
+    ("pgp/js-h/1?lang=eng&id=p17,p19", "[[Joseph Smith—History 1#17|TEXT]][[Joseph Smith—History 1#19|]]"),
+    ("ot/isa/53?lang=eng&id=p3-p5,p7#p3", "[[Isaiah 53#3|TEXT]][[Isaiah 53#4|]][[Isaiah 53#5|]][[Isaiah 53#7|]]"),
+    ("bofm/alma/32?lang=eng", "[[Alma 32|TEXT]]"),
+    ("nt/philip/4?lang=eng&id=p8#p8", None),  # Book abbreviation not in the map
+    ("bofm", None),
+    ("https://www.churchofjesuschrist.org/study/ensign/2000/10/x?lang=eng&id=p3#p3", None),
+]
+
+
+@pytest.mark.parametrize("href, expected", WIKILINK_CASES)
+def test_get_wikilink_matches_old_output(scraper, href, expected):
+    href = href if href.startswith("http") else SCRIPTURES + href
+    assert scraper.get_wikilink(href, "TEXT") == expected
+
+
+def test_parse_scripture_link(scraper):
+    assert scraper.parse_scripture_link(SCRIPTURES + "ot/isa/53?lang=eng&id=p3-p5,p7#p3") == ("Isaiah 53", (3, 4, 5, 7))
+    assert scraper.parse_scripture_link(SCRIPTURES + "bofm/alma/32?lang=eng") == ("Alma 32", ())
+    assert scraper.parse_scripture_link(SCRIPTURES + "nt/philip/4") is None
+
+
+# --- scrape-conference.py: node_to_markdown / element_to_markdown ---
+
+# (innerHTML as the browser serialized it, is_source, markdown the old regex pipeline produced)
+MARKDOWN_CASES = [
+    ("Hello <em>world</em> &lt;x&gt; Dallin&nbsp;H. Oaks &amp; friends", False,
+     "Hello *world* &lt;x&gt; Dallin&nbsp;H. Oaks &amp; friends"),
+    ("“Ask,” he said.<sup class=\"marker\" data-value=\"1\"><a href=\"#note1\" class=\"note-ref\">1</a></sup> "
+     "<span class=\"x\">Plain</span> <strong>bold</strong>", False,
+     "“Ask,” he said.[^ note1] Plain **bold**"),
+    ("<a class=\"backref\" href=\"#note1-ref\">1.</a> See <a href=\"https://www.churchofjesuschrist.org/study/ensign/2000/10/x"
+     "?lang=eng&amp;id=p3#p3\">“X,”</a> <em>Ensign</em>, Apr.", True,
+     "See [“X,”](https://www.churchofjesuschrist.org/study/ensign/2000/10/x?lang=eng&amp;id=p3#p3) *Ensign*, Apr."),
+    ("Philippians 4:8 (<a href=\"https://www.churchofjesuschrist.org/study/scriptures/nt/philip/4?lang=eng&amp;id=p8#p8\">"
+     "Philippians 4:8</a>)", True,
+     "Philippians 4:8 ([Philippians 4:8](https://www.churchofjesuschrist.org/study/scriptures/nt/philip/4?lang=eng&amp;id=p8#p8))"),
+    ("<a href=\"/study/scriptures/bofm/alma/32#p21\">Alma 32:21</a> and <a href=\"/study/scriptures/bofm/mosiah/2\">Mosiah 2</a>",
+     False, "[[Alma 32#21|Alma 32:21]] and [[Mosiah 2|Mosiah 2]]"),
+    ("Just text&nbsp;", False, "Just text&nbsp;"),
+]
+
+
+def to_markdown(scraper, inner_html, is_source):
+    import lxml.html
+    return scraper.element_to_markdown(lxml.html.fragment_fromstring(inner_html, create_parent="p"), is_source)
+
+
+@pytest.mark.parametrize("inner_html, is_source, expected", MARKDOWN_CASES)
+def test_element_to_markdown_matches_old_output(scraper, inner_html, is_source, expected):
+    assert to_markdown(scraper, inner_html, is_source) == expected
+
+
+def test_escaped_scripture_query_keeps_its_verses(scraper):
+    # Deliberate change: the old pipeline saw "&amp;id=" in the escaped innerHTML, lost the id and wrote
+    # [[D&C 58|...]] with no verse anchors. The link is now parsed from the decoded href.
+    inner_html = "See <a href=\"/study/scriptures/dc-testament/dc/58?lang=eng&amp;id=p26-p28#p26\">D&amp;C 58:26–28</a>."
+    assert to_markdown(scraper, inner_html, True) == "See [[D&C 58#26|D&amp;C 58:26–28]][[D&C 58#27|]][[D&C 58#28|]]."
+
+
+# --- scrape-conference.py: ROLE_RE via normalize_role ---
+
+ROLE_CASES = [
+    ("Of the Quorum of the Twelve Apostles", "Quorum of the 12"),
+    ("of the quorum of the twelve apostles", "Quorum of the 12"),
+    ("Acting President of the Quorum of the Twelve Apostles", "Acting President of the Quorum of the 12"),
+    ("Q_of_12", "Quorum of the 12"),
+    ("Council of the 12", "Quorum of the 12"),
+    ("Of the Seventy", "Seventy"),
+    ("Of the 70", "Seventy"),
+    ("Released Member of the Seventy", "Seventy"),
+    ("Emeritus member of the Seventy", "Seventy"),
+    ("Presidency of the First Q_of_70", "Seventy"),
+    ("Presidency of the Seventy", "Presidency of the Seventy"),
+    ("General Authority Seventy", "General Authority Seventy"),
+    ("President of The Church of Jesus Christ of Latter-day Saints", "President of the Church"),
+    ("Second Counselor in the First Presidency", "Second Counselor in the First Presidency"),
+    ("Presiding Bishop", "Presiding Bishop"),
+    ("", None),
+    (None, None),
+]
+
+
+@pytest.mark.parametrize("role, expected", ROLE_CASES)
+def test_normalize_role_matches_old_output(scraper, role, expected):
+    assert scraper.normalize_role(role) == expected
+
+
+# --- add_conference_resource_newsroom.py: batch reply parsing ---
+
+QUERIES = [
+    ("The Doctrine of Belonging", "Elder D. Todd Christofferson", "Quorum of the 12", "2022", "October"),
+    ("What Is True?", "President Russell M. Nelson", "President of the Church", "2022", "October"),
+    ("Lifted Up upon the Cross", "Elder Jeffrey R. Holland", "Quorum of the 12", "2022", "October"),
+]
+BELONGING_URL = "https://www.thechurchnews.com/general-conference/2022/10/2/doctrine-of-belonging"
+
+
+@pytest.fixture
+def batch_reply(newsroom, monkeypatch):
+    newsroom._cache.clear()
+
+    def reply_with(content, queries=QUERIES):
+        monkeypatch.setattr(newsroom, "ask_grok", lambda *args, **kwargs: content)
+        return newsroom.find_newsroom_urls_batch(queries)
+    return reply_with
+
+
+def is_cached(newsroom, query):
+    title, speaker, _, year, month = query
+    return newsroom.get_cached_url(newsroom.get_cache_key(title, speaker, year, month))[0]
+
+
+def test_batch_reply_matches_single_lookup(newsroom, batch_reply):
+    reply = {
+        "The Doctrine of Belonging": BELONGING_URL + ".",  # Same trailing-punctuation trim as a single reply
+        "What Is True?": None,
+        "Lifted Up upon the Cross": "Not found",
+    }
+    urls = batch_reply("```json\n" + json.dumps(reply) + "\n```")
+    assert urls == [newsroom.extract_newsroom_url(answer) for answer in reply.values()]
+    assert urls == [BELONGING_URL, None, None]
+    assert all(is_cached(newsroom, query) for query in QUERIES)  # Answered misses are cached too
+
+
+def test_batch_reply_matches_titles_across_quote_styles(batch_reply):
+    queries = [("“Come unto Me”", "Elder Gary E. Stevenson", "Quorum of the 12", "2022", "October")]
+    assert batch_reply(json.dumps({'"Come unto Me"': BELONGING_URL}), queries) == [BELONGING_URL]
+
+
+def test_batch_reply_leaves_unanswered_and_malformed_entries_uncached(newsroom, batch_reply):
+    urls = batch_reply(json.dumps({"The Doctrine of Belonging": {"url": BELONGING_URL}}))
+    assert urls == [None, None, None]
+    assert not any(is_cached(newsroom, query) for query in QUERIES)
+
+
+@pytest.mark.parametrize("content", ["Not JSON at all", "[1, 2]", None, "skipped"])
+def test_batch_reply_unusable(newsroom, batch_reply, content):
+    if content == "skipped":
+        content = newsroom.SKIPPED
+    assert batch_reply(content) == [None, None, None]
+    assert not any(is_cached(newsroom, query) for query in QUERIES)
+
+
+# --- scripture_gpt_summaries.py: JSON summary reply ---
+
+# The JSON object the prompt now asks for, holding the same answer as an old labelled-text reply
+NEW_REPLY = {
+    "child_summary": "Alma teaches that faith is like a seed.",
+    "normal_summary": "Alma compares the word of God to a seed that grows when it is nourished.",
+    "context_summary": "Alma preaches to the poor Zoramites.",
+    "tags": ["#Gospel/Faith", "#Gospel/Word_of_God"],
+    "related_scriptures": [
+        {"link": "[[Ether 12#6]] ", "description": "Faith and trial"},
+        {"link": "[[Hebrews 11#1]]", "description": "Faith defined"},
+        {"link": "[[Alma 33#1]]"},  # No description: dropped, as the old "link ~ reason" split did
+    ],
+}
+# What the old section parser made of that reply. Its related links differed on purpose: it stripped the opening
+# brackets off the first wikilink ("Ether 12#6]]"), which the JSON list no longer does
+OLD_PARSED = (
+    "Alma teaches that faith is like a seed.",
+    "Alma compares the word of God to a seed that grows when it is nourished.",
+    "Alma preaches to the poor Zoramites.",
+    "#Gospel/Faith #Gospel/Word_of_God",
+)
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+        self.usage = type("Usage", (), {"prompt_tokens": 10, "completion_tokens": 20, "reasoning_tokens": 5, "num_sources_used": 2})()
+
+
+class FakeClient:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.chat = self
+
+    def create(self, **kwargs):
+        return self
+
+    def append(self, message):
+        pass
+
+    def sample(self):
+        return FakeResponse(self.replies.pop(0))
+
+
+@pytest.fixture
+def generate(summaries, monkeypatch):
+    monkeypatch.setattr(summaries, "use_cache", False)
+    monkeypatch.setattr(summaries.time, "sleep", lambda seconds: None)
+
+    def generate_with(*replies):
+        client = FakeClient(replies)
+        monkeypatch.setattr(summaries, "client", client)
+        return summaries.generate_ai_summaries("Alma", 32, {"1": "text"}), client
+    return generate_with
+
+
+def test_json_reply_matches_old_labelled_reply(generate):
+    result, _ = generate(json.dumps(NEW_REPLY))
+    assert result[:4] == OLD_PARSED
+    assert result[4] == [
+        {"link": "[[Ether 12#6]]", "description": "Faith and trial"},
+        {"link": "[[Hebrews 11#1]]", "description": "Faith defined"},
+    ]
+    assert result[5:] == (10, 20, 5, 2)
+
+
+def test_json_reply_without_summaries_is_retried(generate):
+    result, client = generate("{}", '{"child_summary": "Only one"}', json.dumps(NEW_REPLY))
+    assert result[:4] == OLD_PARSED
+    assert client.replies == []
+
+
+def test_json_reply_malformed_every_time_gives_empty_result(summaries, generate):
+    result, _ = generate(*["not json"] * summaries.MAX_RETRIES)
+    assert result == ("", "", "", "", [], 0, 0, 0, 0)